@@ -1,77 +1,295 @@
+import time
+IMPORT_START = time.perf_counter()
+
 import asyncio
+import logging
+import os
 import platform
-from fastapi import FastAPI, Depends
-from sqlalchemy.orm import Session
-from config.database import engine, SessionLocal
-from models.base import Base
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from config.database import (SessionLocal, AsyncSessionLocal, ReadSessionLocal, AsyncReadSessionLocal,
+                             get_active_engine, get_active_read_engine, has_read_replica)
+from config.settings import get_settings
+from config.pool import pool_status
+from middlewares.metrics import registry, instrument_engine, metrics_middleware
+from middlewares.admission import admission_middleware
+from middlewares.replica import ler_do_principal, read_your_writes_middleware
 from controllers.factory import ControllerFactory
+from controllers.threadpool import ThreadpoolController
+from controllers.etag import etag_recurso, etag_pagina, etag_matches
+from controllers.export import MEDIA_TYPES
+from controllers.serializacao import RespostaJSON
 from schemas.schema import *
-from typing import List
+from datetime import date
+from typing import List, Literal, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tempos de importação e de subida (segundos), expostos em /metrics
+STARTUP_TIMES = {}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A importação não toca no banco: as tabelas são criadas por
+    # "python manage.py create-schema" e o engine só é montado aqui, na subida
+    # de cada processo: com vários workers, cada um tem o próprio pool
+    engine = get_active_engine()
+    instrument_engine(engine)
+    engines = [engine]
+    if has_read_replica():
+        engines.append(get_active_read_engine())
+        instrument_engine(engines[-1])
+    STARTUP_TIMES["boot"] = time.perf_counter() - IMPORT_START
+    logger.info("Processo %d pronto em %.1f ms (importação: %.1f ms)", os.getpid(),
+                STARTUP_TIMES["boot"] * 1000, STARTUP_TIMES["import"] * 1000)
+    yield
+    for engine in engines:
+        if get_settings().db_async:
+            await engine.dispose()
+        else:
+            engine.dispose()
+
+app = FastAPI(title="API de Gerenciamento de Pedidos", lifespan=lifespan)
+
+# Limites de concorrência por rota (ADMISSION_LIMITS): 503 rápido quando saturada
+app.middleware("http")(admission_middleware)
+# Marca o cliente para ler do banco principal logo após uma escrita
+app.middleware("http")(read_your_writes_middleware)
+# Latência e status por rota, tempo de cada consulta SQL e consultas por requisição.
+# Registrado por último, envolve o controle de admissão e também mede os 503
+app.middleware("http")(metrics_middleware)
+
+# Dependência para sessão de banco, conforme o modo configurado (DB_ASYNC)
+async def get_session():
+    if get_settings().db_async:
+        async with AsyncSessionLocal() as db:
+            yield db
+    else:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
+
+# Sessão das rotas de leitura: réplica (READ_DATABASE_URL), a não ser que o
+# cliente tenha escrito há pouco e precise ver a própria escrita
+async def get_read_session(request: Request):
+    principal = ler_do_principal(request)
+    if get_settings().db_async:
+        async with (AsyncSessionLocal() if principal else AsyncReadSessionLocal()) as db:
+            yield db
+    else:
+        db = SessionLocal() if principal else ReadSessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
+
+# Dependência para controlador
+def pedido_controller(db):
+    if get_settings().db_async:
+        return ControllerFactory.create_async_pedido_controller(db)
+    return ThreadpoolController(ControllerFactory.create_pedido_controller(db))
+
+def cliente_controller(db):
+    if get_settings().db_async:
+        return ControllerFactory.create_async_cliente_controller(db)
+    return ThreadpoolController(ControllerFactory.create_cliente_controller(db))
+
+def relatorio_controller(db):
+    if get_settings().db_async:
+        return ControllerFactory.create_async_relatorio_controller(db)
+    return ThreadpoolController(ControllerFactory.create_relatorio_controller(db))
+
+def get_pedido_controller(db = Depends(get_session)):
+    return pedido_controller(db)
+
+def get_cliente_controller(db = Depends(get_session)):
+    return cliente_controller(db)
+
+def get_pedido_read_controller(db = Depends(get_read_session)):
+    return pedido_controller(db)
 
-app = FastAPI(title="API de Gerenciamento de Pedidos")
+def get_cliente_read_controller(db = Depends(get_read_session)):
+    return cliente_controller(db)
 
-# Criar tabelas no banco, se não existirem
-Base.metadata.create_all(bind=engine)
+def get_relatorio_read_controller(db = Depends(get_read_session)):
+    return relatorio_controller(db)
 
-# Dependência para sessão de banco
-def get_db():
-    db = SessionLocal()
+# Tamanho de página padrão e máximo para as listagens
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Respostas podem ser guardadas por clientes e caches intermediários, mas
+# sempre revalidadas com If-None-Match (respondido com 304 se nada mudou)
+CACHE_CONTROL = "no-cache"
+
+def cache_headers(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+@app.get("/pedidos", response_model=PaginaPedidoSchema)
+async def listar_pedidos(request: Request, response: Response,
+                         limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None,
+                         filtro: PedidoFiltroSchema = Depends(), controller = Depends(get_pedido_read_controller)):
+    # Com If-None-Match, confere só ids e versões da página antes de carregá-la
+    if request.headers.get("if-none-match"):
+        etag = await controller.etag_pagina_pedidos(limit, after, filtro)
+        if etag_matches(request.headers["if-none-match"], etag):
+            return not_modified(etag)
+    if get_settings().fast_json:
+        # Devolver a Response pula a validação do response_model
+        pagina = await controller.listar_pedidos_json(limit, after, filtro)
+        resposta = RespostaJSON(pagina)
+        cache_headers(resposta, etag_pagina("pedido", [(x["id"], x["versao"]) for x in pagina["itens"]], pagina["next"]))
+        return resposta
+    pagina = await controller.listar_pedidos(limit, after, filtro)
+    cache_headers(response, etag_pagina("pedido", [(x.id, x.versao) for x in pagina.itens], pagina.next))
+    return pagina
+
+# A exportação abre a própria sessão, que precisa ficar aberta até o fim do
+# streaming (depois que a rota já retornou)
+def exportar_pedidos_sync(formato: str, data_inicio: Optional[date], data_fim: Optional[date], principal: bool):
+    db = SessionLocal() if principal else ReadSessionLocal()
     try:
-        yield db
+        controller = ControllerFactory.create_pedido_controller(db)
+        yield from controller.exportar_pedidos(formato, data_inicio, data_fim)
     finally:
         db.close()
 
-# Dependência para controlador
-def get_pedido_controller(db: Session = Depends(get_db)):
-    return ControllerFactory.create_pedido_controller(db)
-
-def get_cliente_controller(db: Session = Depends(get_db)):
-    return ControllerFactory.create_cliente_controller(db)
+async def exportar_pedidos_async(formato: str, data_inicio: Optional[date], data_fim: Optional[date], principal: bool):
+    async with (AsyncSessionLocal() if principal else AsyncReadSessionLocal()) as db:
+        controller = ControllerFactory.create_async_pedido_controller(db)
+        async for bloco in controller.exportar_pedidos(formato, data_inicio, data_fim):
+            yield bloco
 
-@app.get("/pedidos", response_model=List[PedidoOutSchema])
-def listar_pedidos(controller = Depends(get_pedido_controller)):
-    return controller.listar_pedidos()
+@app.get("/pedidos/export")
+async def exportar_pedidos(request: Request, formato: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+                           data_inicio: Optional[date] = None, data_fim: Optional[date] = None):
+    if data_inicio and data_fim and data_inicio > data_fim:
+        raise HTTPException(status_code=400, detail="data_inicio deve ser anterior a data_fim")
+    exportar = exportar_pedidos_async if get_settings().db_async else exportar_pedidos_sync
+    return StreamingResponse(exportar(formato, data_inicio, data_fim, ler_do_principal(request)), media_type=MEDIA_TYPES[formato],
+                             headers={"Content-Disposition": f"attachment; filename=pedidos.{formato}"})
 
 @app.get("/pedidos/{pedido_id}", response_model=PedidoOutSchema)
-def ler_pedido(pedido_id: int, controller = Depends(get_pedido_controller)):
-    return controller.ler_pedido(pedido_id)
+async def ler_pedido(pedido_id: int, request: Request, response: Response,
+                     controller = Depends(get_pedido_read_controller)):
+    if request.headers.get("if-none-match"):
+        etag = await controller.etag_pedido(pedido_id)
+        if etag_matches(request.headers["if-none-match"], etag):
+            return not_modified(etag)
+    pedido = await controller.ler_pedido(pedido_id)
+    cache_headers(response, etag_recurso("pedido", pedido.id, pedido.versao))
+    return pedido
+
+@app.get("/pedidos/{pedido_id}/total", response_model=TotalPedidoSchema)
+async def total_pedido(pedido_id: int, controller = Depends(get_relatorio_read_controller)):
+    return await controller.total_pedido(pedido_id)
 
 @app.post("/pedidos", response_model=PedidoOutSchema, status_code=201)
-def criar_pedido(pedido_data: PedidoCreateSchema, controller = Depends(get_pedido_controller)):
-    return controller.criar_pedido(pedido_data)
+async def criar_pedido(pedido_data: PedidoCreateSchema, controller = Depends(get_pedido_controller)):
+    return await controller.criar_pedido(pedido_data)
+
+@app.post("/pedidos/batch", response_model=PedidoBatchOutSchema, status_code=201)
+async def criar_pedidos_lote(lote: PedidoBatchSchema, controller = Depends(get_pedido_controller)):
+    # Todos os pedidos válidos do lote são gravados em uma única transação
+    return await controller.criar_pedidos_lote(lote)
 
 @app.put("/pedidos/{pedido_id}", response_model=PedidoOutSchema)
-def atualizar_pedido(pedido_id: int, update_data: PedidoUpdateSchema, controller = Depends(get_pedido_controller)):
-    return controller.atualizar_pedido(pedido_id, update_data)
+async def atualizar_pedido(pedido_id: int, update_data: PedidoUpdateSchema, controller = Depends(get_pedido_controller)):
+    return await controller.atualizar_pedido(pedido_id, update_data)
 
 @app.delete("/pedidos/{pedido_id}", status_code=204)
-def deletar_pedido(pedido_id: int, controller = Depends(get_pedido_controller)):
-    controller.deletar_pedido(pedido_id)
+async def deletar_pedido(pedido_id: int, controller = Depends(get_pedido_controller)):
+    await controller.deletar_pedido(pedido_id)
     return None
 
-@app.get("/clientes",response_model=List[ClienteOutSchema])
-def listar_clientes(Controller = Depends(get_cliente_controller)):
-    return Controller.listar_clientes()
+@app.get("/clientes", response_model=PaginaClienteSchema)
+async def listar_clientes(request: Request, response: Response,
+                          limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None,
+                          controller = Depends(get_cliente_read_controller)):
+    # Com If-None-Match, confere só ids e versões da página antes de carregá-la
+    if request.headers.get("if-none-match"):
+        etag = await controller.etag_pagina_clientes(limit, after)
+        if etag_matches(request.headers["if-none-match"], etag):
+            return not_modified(etag)
+    if get_settings().fast_json:
+        pagina = await controller.listar_clientes_json(limit, after)
+        resposta = RespostaJSON(pagina)
+        cache_headers(resposta, etag_pagina("cliente", [(x["id"], x["versao"]) for x in pagina["itens"]], pagina["next"]))
+        return resposta
+    pagina = await controller.listar_clientes(limit, after)
+    cache_headers(response, etag_pagina("cliente", [(x.id, x.versao) for x in pagina.itens], pagina.next))
+    return pagina
 
 @app.get("/clientes/{cliente_id}", response_model=ClienteOutSchema)
-def ler_cliente(cliente_id: int, controller = Depends(get_cliente_controller)):
-    return controller.ler_cliente(cliente_id)
+async def ler_cliente(cliente_id: int, request: Request, response: Response,
+                      controller = Depends(get_cliente_read_controller)):
+    if request.headers.get("if-none-match"):
+        etag = await controller.etag_cliente(cliente_id)
+        if etag_matches(request.headers["if-none-match"], etag):
+            return not_modified(etag)
+    cliente = await controller.ler_cliente(cliente_id)
+    cache_headers(response, etag_recurso("cliente", cliente.id, cliente.versao))
+    return cliente
 
 @app.post("/clientes", response_model=ClienteOutSchema, status_code=201)
-def criar_cliente(cliente_data: ClienteCreateSchema, controller = Depends(get_cliente_controller)):
-    return controller.criar_cliente(cliente_data)
+async def criar_cliente(cliente_data: ClienteCreateSchema, controller = Depends(get_cliente_controller)):
+    return await controller.criar_cliente(cliente_data)
 
 @app.put("/clientes/{cliente_id}", response_model=ClienteOutSchema)
-def atualizar_cliente(cliente_id: int, update_data: ClienteUpdateSchema, controller = Depends(get_cliente_controller)):
-    return controller.atualizar_cliente(cliente_id, update_data)
+async def atualizar_cliente(cliente_id: int, update_data: ClienteUpdateSchema, controller = Depends(get_cliente_controller)):
+    return await controller.atualizar_cliente(cliente_id, update_data)
 
 @app.delete("/clientes/{cliente_id}", status_code=204)
-def deletar_cliente(cliente_id: int, controller = Depends(get_cliente_controller)):
-    controller.deletar_cliente(cliente_id)
+async def deletar_cliente(cliente_id: int, controller = Depends(get_cliente_controller)):
+    await controller.deletar_cliente(cliente_id)
     return None
 
+# Relatórios: agregados calculados no banco, em uma consulta cada
+@app.get("/relatorios/receita-diaria", response_model=List[ReceitaDiaSchema])
+async def receita_por_dia(data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                          controller = Depends(get_relatorio_read_controller)):
+    return await controller.receita_por_dia(data_inicio, data_fim)
+
+@app.get("/relatorios/receita-por-cliente", response_model=List[ReceitaClienteSchema])
+async def receita_por_cliente(data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                              limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+                              controller = Depends(get_relatorio_read_controller)):
+    return await controller.receita_por_cliente(data_inicio, data_fim, limit)
+
+@app.get("/relatorios/produtos-mais-vendidos", response_model=List[ProdutoVendidoSchema])
+async def produtos_mais_vendidos(data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                                 limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+                                 controller = Depends(get_relatorio_read_controller)):
+    return await controller.produtos_mais_vendidos(data_inicio, data_fim, limit)
+
+@app.get("/pool")
+async def estatisticas_pool():
+    # Contadores do pool de conexões, para dimensionar DB_POOL_SIZE/DB_MAX_OVERFLOW
+    return pool_status(get_active_engine())
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metricas():
+    # Formato texto do Prometheus
+    pool = pool_status(get_active_engine())
+    gauges = {f"db_pool_{nome}": valor for nome, valor in pool.items()}
+    if has_read_replica():
+        gauges.update({f"db_read_pool_{nome}": valor for nome, valor in pool_status(get_active_read_engine()).items()})
+    gauges.update({f"app_{etapa}_seconds": valor for etapa, valor in STARTUP_TIMES.items()})
+    return PlainTextResponse(registry.render(gauges), media_type="text/plain; version=0.0.4")
+
+STARTUP_TIMES["import"] = time.perf_counter() - IMPORT_START
+
 if __name__ == "__main__":
     import uvicorn
+    # Modo de desenvolvimento (um processo, reload); em produção: python server.py
     # Configurar SelectorEventLoop no Windows para evitar erros de conexão
     if platform.system() == "Windows":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
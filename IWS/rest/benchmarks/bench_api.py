@@ -0,0 +1,254 @@
+# Benchmark HTTP da API de pedidos.
+#
+# Sobe a aplicação com uvicorn contra um banco SQLite local, popula clientes,
+# pedidos e itens no volume pedido e mede, rota a rota, vazão e latências
+# p50/p95/p99. O resultado é salvo em JSON para comparar execuções:
+#
+#   python benchmarks/bench_api.py --pedidos 20000 --output base.json
+#   python benchmarks/bench_api.py --pedidos 20000 --compare base.json
+#
+# Requer httpx e uvicorn (benchmarks/requirements.txt).
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+def configurar_ambiente(db_path: Path, pool_size: int):
+    # Precisa acontecer antes da primeira chamada de get_settings()
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+    os.environ.setdefault("DB_POOL_SIZE", str(pool_size))
+    # Sem controle de admissão, salvo se pedido explicitamente: 503 rápidos
+    # inflariam a vazão medida
+    os.environ.setdefault("ADMISSION_LIMITS", "")
+
+def popular_banco(clientes: int, pedidos: int, itens_por_pedido: int, seed: int):
+    from sqlalchemy import insert
+    from config.database import get_engine
+    from models.base import Base
+    from models.cliente import Cliente
+    from models.pedido import Pedido
+    from models.item_pedido import ItemPedido
+
+    engine = get_engine()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    aleatorio = random.Random(seed)
+    produtos = [f"Produto {n}" for n in range(200)]
+    inicio = date.today() - timedelta(days=365)
+    lote = 5000
+    with engine.begin() as conn:
+        linhas = [{"nome": f"Cliente {n}", "idade": aleatorio.randint(18, 80)} for n in range(clientes)]
+        for i in range(0, len(linhas), lote):
+            conn.execute(insert(Cliente), linhas[i:i + lote])
+        for i in range(0, pedidos, lote):
+            faixa = range(i + 1, min(i + lote, pedidos) + 1)
+            conn.execute(insert(Pedido), [
+                {"id": pedido_id, "cliente": f"Cliente {aleatorio.randrange(max(clientes, 1))}",
+                 "data_pedido": inicio + timedelta(days=aleatorio.randrange(365))}
+                for pedido_id in faixa])
+            conn.execute(insert(ItemPedido), [
+                {"pedido_id": pedido_id, "produto": aleatorio.choice(produtos),
+                 "quantidade": aleatorio.randint(1, 5), "preco": round(aleatorio.uniform(5, 500), 2)}
+                for pedido_id in faixa for _ in range(itens_por_pedido)])
+    engine.dispose()
+
+def novo_pedido(aleatorio: random.Random) -> dict:
+    return {"cliente": f"Cliente {aleatorio.randrange(1000)}",
+            "itens": [{"produto": "Produto bench", "quantidade": 1, "preco": "10.00"},
+                      {"produto": "Frete", "quantidade": 1, "preco": "5.00"}]}
+
+def cenarios(pedidos: int, clientes: int, aleatorio: random.Random):
+    # Cada cenário gera (método, url, corpo) para uma requisição. Atualizações
+    # e exclusões usam faixas de ids separadas para não interferir nas leituras
+    leitura = max(pedidos // 2, 1)
+    exclusoes_pedido = iter(range(pedidos, leitura, -1))
+    exclusoes_cliente = iter(range(clientes, max(clientes // 2, 1), -1))
+    return {
+        "GET /pedidos": lambda: ("GET", "/pedidos?limit=50", None),
+        "GET /pedidos?after": lambda: ("GET", f"/pedidos?limit=50&after={_cursor(aleatorio.randint(1, leitura))}", None),
+        "GET /pedidos/{pedido_id}": lambda: ("GET", f"/pedidos/{aleatorio.randint(1, leitura)}", None),
+        "POST /pedidos": lambda: ("POST", "/pedidos", novo_pedido(aleatorio)),
+        "POST /pedidos/batch": lambda: ("POST", "/pedidos/batch",
+                                        {"pedidos": [novo_pedido(aleatorio) for _ in range(100)]}),
+        "PUT /pedidos/{pedido_id}": lambda: ("PUT", f"/pedidos/{aleatorio.randint(leitura + 1, pedidos)}",
+                                             {"cliente": "Cliente atualizado"}),
+        "DELETE /pedidos/{pedido_id}": lambda: ("DELETE", f"/pedidos/{next(exclusoes_pedido)}", None),
+        "GET /pedidos/{pedido_id}/total": lambda: ("GET", f"/pedidos/{aleatorio.randint(1, leitura)}/total", None),
+        "GET /relatorios/receita-diaria": lambda: ("GET", "/relatorios/receita-diaria", None),
+        "GET /relatorios/receita-por-cliente": lambda: ("GET", "/relatorios/receita-por-cliente?limit=20", None),
+        "GET /relatorios/produtos-mais-vendidos": lambda: ("GET", "/relatorios/produtos-mais-vendidos", None),
+        "GET /pedidos/export": lambda: ("GET", f"/pedidos/export?format=ndjson&data_inicio={date.today() - timedelta(days=7)}", None),
+        "GET /clientes": lambda: ("GET", "/clientes?limit=50", None),
+        "GET /clientes/{cliente_id}": lambda: ("GET", f"/clientes/{aleatorio.randint(1, max(clientes // 2, 1))}", None),
+        "POST /clientes": lambda: ("POST", "/clientes", {"nome": "Cliente bench", "idade": 30}),
+        "PUT /clientes/{cliente_id}": lambda: ("PUT", f"/clientes/{aleatorio.randint(1, max(clientes // 2, 1))}",
+                                               {"idade": aleatorio.randint(18, 80)}),
+        "DELETE /clientes/{cliente_id}": lambda: ("DELETE", f"/clientes/{next(exclusoes_cliente)}", None),
+    }
+
+def _cursor(pedido_id: int) -> str:
+    from controllers.cursor import encode_cursor
+    return encode_cursor(pedido_id)
+
+def percentil(valores, p: float) -> float:
+    # Percentil pelo método nearest-rank
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(math.ceil(p / 100 * len(ordenados)) - 1, 0)
+    return ordenados[indice]
+
+async def medir_rota(cliente, gerar, total: int, concorrencia: int) -> dict:
+    # Respostas 503 (recusadas pelo controle de admissão) são contadas à
+    # parte e ficam fora da vazão e das latências
+    latencias, erros, recusadas = [], 0, 0
+    semaforo = asyncio.Semaphore(concorrencia)
+
+    async def uma_requisicao():
+        nonlocal erros, recusadas
+        async with semaforo:
+            metodo, url, corpo = gerar()
+            inicio = time.perf_counter()
+            try:
+                resposta = await cliente.request(metodo, url, json=corpo)
+                await resposta.aread()
+                if resposta.status_code == 503:
+                    recusadas += 1
+                    return
+                if resposta.status_code >= 400:
+                    erros += 1
+            except Exception:
+                erros += 1
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(uma_requisicao() for _ in range(total)))
+    duracao = time.perf_counter() - inicio
+    ms = [valor * 1000 for valor in latencias]
+    return {
+        "requests": total,
+        "errors": erros,
+        "shed_503": recusadas,
+        "duration_s": round(duracao, 4),
+        "throughput_rps": round(len(latencias) / duracao, 2) if duracao else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(ms), 3) if ms else 0.0,
+            "p50": round(percentil(ms, 50), 3),
+            "p95": round(percentil(ms, 95), 3),
+            "p99": round(percentil(ms, 99), 3),
+            "max": round(max(ms), 3) if ms else 0.0,
+        },
+    }
+
+async def executar(base_url: str, args) -> dict:
+    import httpx
+    aleatorio = random.Random(args.seed)
+    rotas = cenarios(args.pedidos, args.clientes, aleatorio)
+    if args.routes:
+        rotas = {nome: gerar for nome, gerar in rotas.items() if nome in args.routes}
+    limites = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    resultados = {}
+    async with httpx.AsyncClient(base_url=base_url, limits=limites, timeout=60) as cliente:
+        for nome, gerar in rotas.items():
+            # Aquecimento, fora da medição
+            await medir_rota(cliente, gerar, min(args.warmup, args.requests), args.concurrency)
+            resultados[nome] = await medir_rota(cliente, gerar, args.requests, args.concurrency)
+            r = resultados[nome]
+            print(f"{nome:40} {r['throughput_rps']:>9.1f} req/s  p50 {r['latency_ms']['p50']:>8.2f} ms  "
+                  f"p95 {r['latency_ms']['p95']:>8.2f} ms  p99 {r['latency_ms']['p99']:>8.2f} ms  "
+                  f"erros {r['errors']}  503 {r['shed_503']}")
+    return resultados
+
+def subir_servidor(porta: int):
+    import uvicorn
+    from app import app
+    servidor = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=porta, log_level="warning"))
+    thread = threading.Thread(target=servidor.run, daemon=True)
+    thread.start()
+    while not servidor.started:
+        time.sleep(0.05)
+    return servidor, thread
+
+def commit_atual() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido"
+
+def comparar(atual: dict, arquivo_base: Path):
+    base = json.loads(arquivo_base.read_text())["routes"]
+    print(f"\nComparação com {arquivo_base} (variação de vazão / p95):")
+    for nome, r in atual.items():
+        if nome not in base:
+            continue
+        b = base[nome]
+        vazao = (r["throughput_rps"] / b["throughput_rps"] - 1) * 100 if b["throughput_rps"] else 0.0
+        p95 = (r["latency_ms"]["p95"] / b["latency_ms"]["p95"] - 1) * 100 if b["latency_ms"]["p95"] else 0.0
+        print(f"{nome:40} vazão {vazao:+7.1f}%  p95 {p95:+7.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP da API de pedidos")
+    parser.add_argument("--clientes", type=int, default=1000)
+    parser.add_argument("--pedidos", type=int, default=10000)
+    parser.add_argument("--itens-por-pedido", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=500, help="requisições medidas por rota")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", type=Path, default=RAIZ / "benchmarks" / "bench.db")
+    parser.add_argument("--routes", nargs="*", help="mede só estas rotas (ex.: 'GET /pedidos')")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="JSON de uma execução anterior")
+    args = parser.parse_args()
+    if args.pedidos < 2 or args.clientes < 2:
+        parser.error("--pedidos e --clientes precisam ser ao menos 2")
+    exclusoes = args.requests + args.warmup
+    if exclusoes > args.pedidos // 2 or exclusoes > args.clientes // 2:
+        parser.error("volume insuficiente para as exclusões: aumente --pedidos/--clientes ou reduza --requests")
+
+    configurar_ambiente(args.db, args.concurrency)
+    inicio = time.perf_counter()
+    popular_banco(args.clientes, args.pedidos, args.itens_por_pedido, args.seed)
+    print(f"Banco populado em {time.perf_counter() - inicio:.1f} s ({args.db})")
+
+    servidor, thread = subir_servidor(args.port)
+    try:
+        resultados = asyncio.run(executar(f"http://127.0.0.1:{args.port}", args))
+    finally:
+        servidor.should_exit = True
+        thread.join()
+
+    relatorio = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"clientes": args.clientes, "pedidos": args.pedidos, "itens_por_pedido": args.itens_por_pedido,
+                   "requests": args.requests, "concurrency": args.concurrency,
+                   "db_async": os.getenv("DB_ASYNC", "0") == "1"},
+        "routes": resultados,
+    }
+    saida = args.output or RAIZ / "benchmarks" / "results" / f"bench-{relatorio['commit']}-{int(time.time())}.json"
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    saida.write_text(json.dumps(relatorio, indent=2))
+    print(f"Resultados salvos em {saida}")
+    if args.compare:
+        comparar(resultados, args.compare)
+
+if __name__ == "__main__":
+    main()
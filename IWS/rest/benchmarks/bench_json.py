@@ -0,0 +1,94 @@
+# Benchmark de CPU da serialização das listagens.
+#
+# Monta páginas de pedidos (objetos do ORM em memória, sem banco) e mede o
+# tempo de CPU por resposta em dois caminhos:
+#   padrao: model_validate de cada pedido + o que o FastAPI faz com o
+#           response_model (valida de novo e serializa com json.dumps)
+#   rapido: pedido_dict + RespostaJSON (orjson), como com FAST_JSON=1
+#
+#   python benchmarks/bench_json.py --tamanhos 50 500 --itens-por-pedido 3
+#
+# O efeito na API inteira pode ser medido com o benchmark HTTP:
+#   FAST_JSON=0 python benchmarks/bench_api.py --routes "GET /pedidos" --output base.json
+#   FAST_JSON=1 python benchmarks/bench_api.py --routes "GET /pedidos" --compare base.json
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+def montar_pedidos(quantidade: int, itens_por_pedido: int, seed: int):
+    from models.pedido import Pedido
+    from models.item_pedido import ItemPedido
+    import models.cliente  # registra todos os modelos no mapper
+
+    aleatorio = random.Random(seed)
+    inicio = date.today() - timedelta(days=365)
+    pedidos = []
+    for pedido_id in range(1, quantidade + 1):
+        pedido = Pedido(id=pedido_id, cliente=f"Cliente {aleatorio.randrange(1000)}",
+                        data_pedido=inicio + timedelta(days=aleatorio.randrange(365)), versao=1)
+        pedido.itens = [ItemPedido(id=pedido_id * itens_por_pedido + n, pedido_id=pedido_id,
+                                   produto=f"Produto {aleatorio.randrange(200)}",
+                                   quantidade=aleatorio.randint(1, 5),
+                                   preco=Decimal(f"{aleatorio.uniform(5, 500):.2f}"))
+                        for n in range(itens_por_pedido)]
+        pedidos.append(pedido)
+    return pedidos
+
+def caminho_padrao():
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+    from schemas.schema import PaginaPedidoSchema, PedidoOutSchema
+
+    adapter = TypeAdapter(PaginaPedidoSchema)
+
+    def responder(pedidos) -> bytes:
+        pagina = PaginaPedidoSchema(itens=[PedidoOutSchema.model_validate(x) for x in pedidos], next="abc")
+        # Equivalente ao serialize_response do FastAPI: dump, validação pelo
+        # response_model e serialização em modo JSON
+        conteudo = adapter.dump_python(adapter.validate_python(pagina.model_dump()), mode="json")
+        return JSONResponse(conteudo).body
+    return responder
+
+def caminho_rapido():
+    from controllers.serializacao import RespostaJSON, pedido_dict
+
+    def responder(pedidos) -> bytes:
+        return RespostaJSON({"itens": [pedido_dict(x) for x in pedidos], "next": "abc"}).body
+    return responder
+
+def medir(responder, pedidos, repeticoes: int) -> float:
+    responder(pedidos)  # aquecimento
+    inicio = time.process_time()
+    for _ in range(repeticoes):
+        responder(pedidos)
+    return (time.process_time() - inicio) / repeticoes * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU por resposta das listagens: padrão x rápido")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[50, 500], help="pedidos por página")
+    parser.add_argument("--itens-por-pedido", type=int, default=3)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from controllers.serializacao import orjson
+    print(f"orjson: {'sim' if orjson is not None else 'não (json da biblioteca padrão)'}")
+    caminhos = {"padrao": caminho_padrao(), "rapido": caminho_rapido()}
+    for tamanho in args.tamanhos:
+        pedidos = montar_pedidos(tamanho, args.itens_por_pedido, args.seed)
+        # As duas saídas precisam ter o mesmo conteúdo
+        assert json.loads(caminhos["padrao"](pedidos)) == json.loads(caminhos["rapido"](pedidos))
+        tempos = {nome: medir(responder, pedidos, args.repeticoes) for nome, responder in caminhos.items()}
+        print(f"{tamanho:>5} pedidos  padrao {tempos['padrao']:8.3f} ms CPU  rapido {tempos['rapido']:8.3f} ms CPU  "
+              f"({tempos['padrao'] / tempos['rapido']:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+class PoolStats:
+    # Contadores acumulados de checkout do pool, protegidos por lock porque
+    # o pool é usado por várias threads ao mesmo tempo
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def registrar(self, espera: float, esperou: bool, timeout: bool = False):
+        with self.lock:
+            self.checkouts += 1
+            if esperou:
+                self.waits += 1
+                self.wait_time_total += espera
+                self.wait_time_max = max(self.wait_time_max, espera)
+            if timeout:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "wait_time_total": round(self.wait_time_total, 6),
+                "wait_time_max": round(self.wait_time_max, 6),
+            }
+
+class PoolStatsMixin:
+    # Mede o tempo de cada checkout; conta como espera quando não havia conexão
+    # livre nem espaço para overflow no momento do pedido
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        esgotado = (self._max_overflow > -1 and self.checkedin() == 0
+                    and self.checkedout() >= self.size() + self._max_overflow)
+        inicio = time.perf_counter()
+        try:
+            conexao = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.registrar(time.perf_counter() - inicio, True, timeout=True)
+            raise
+        self.stats.registrar(time.perf_counter() - inicio, esgotado)
+        return conexao
+
+    def recreate(self):
+        # engine.dispose() recria o pool; os contadores continuam acumulando
+        novo = super().recreate()
+        novo.stats = self.stats
+        return novo
+
+class InstrumentedQueuePool(PoolStatsMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(PoolStatsMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_status(engine) -> dict:
+    # Aceita Engine ou AsyncEngine
+    pool = getattr(engine, "sync_engine", engine).pool
+    status = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    if isinstance(pool, PoolStatsMixin):
+        status.update(pool.stats.snapshot())
+    return status
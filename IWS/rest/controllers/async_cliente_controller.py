@@ -0,0 +1,68 @@
+from fastapi import HTTPException, status
+from services.async_cliente_service import AsyncClienteService
+from controllers.cursor import encode_cursor, decode_cursor
+from controllers.etag import etag_recurso, etag_pagina
+from controllers.serializacao import cliente_dict
+from schemas.schema import ClienteCreateSchema, ClienteUpdateSchema, ClienteOutSchema, PaginaClienteSchema
+from typing import Optional
+
+class AsyncClienteController:
+    def __init__(self, service: AsyncClienteService):
+        self.service = service
+
+    async def listar_clientes(self, limit: int, after: Optional[str] = None) -> PaginaClienteSchema:
+        try:
+            after_id = decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        clientes, proximo = await self.service.read_clientes_page(limit, after_id)
+        return PaginaClienteSchema(itens=[ClienteOutSchema.model_validate(x) for x in clientes],
+                                   next=encode_cursor(proximo))
+
+    async def listar_clientes_json(self, limit: int, after: Optional[str] = None) -> dict:
+        # Mesma página de listar_clientes, já como dict para RespostaJSON
+        try:
+            after_id = decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        clientes, proximo = await self.service.read_clientes_page(limit, after_id)
+        return {"itens": [cliente_dict(x) for x in clientes], "next": encode_cursor(proximo)}
+
+    async def etag_cliente(self, cliente_id: int) -> str:
+        try:
+            versao = await self.service.read_cliente_version(cliente_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        return etag_recurso("cliente", cliente_id, versao)
+
+    async def etag_pagina_clientes(self, limit: int, after: Optional[str] = None) -> str:
+        try:
+            after_id = decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        pares, proximo = await self.service.read_clientes_page_versions(limit, after_id)
+        return etag_pagina("cliente", pares, encode_cursor(proximo))
+
+    async def ler_cliente(self, cliente_id: int) -> ClienteOutSchema:
+        try:
+            return ClienteOutSchema.model_validate(await self.service.read_cliente_by_id(cliente_id))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    async def criar_cliente(self, cliente_data: ClienteCreateSchema) -> ClienteOutSchema:
+        try:
+            return ClienteOutSchema.model_validate(await self.service.create_cliente(cliente_data))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def atualizar_cliente(self, cliente_id: int, update_data: ClienteUpdateSchema) -> ClienteOutSchema:
+        try:
+            return ClienteOutSchema.model_validate(await self.service.update_cliente(cliente_id, update_data))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    async def deletar_cliente(self, cliente_id: int) -> None:
+        try:
+            await self.service.delete_cliente(cliente_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,91 @@
+from fastapi import HTTPException, status
+from services.async_pedido_service import AsyncPedidoService
+from services.pedido_service import PedidoService
+from controllers.cursor import encode_cursor, decode_cursor
+from controllers.etag import etag_recurso, etag_pagina
+from controllers.serializacao import pedido_dict
+from controllers.export import em_blocos_async
+from schemas.schema import (PedidoCreateSchema, PedidoUpdateSchema, PedidoOutSchema, PaginaPedidoSchema,
+                            PedidoBatchSchema, PedidoBatchOutSchema, PedidoFiltroSchema)
+from datetime import date
+from typing import AsyncIterator, Optional
+
+class AsyncPedidoController:
+    def __init__(self, service: AsyncPedidoService):
+        self.service = service
+
+    async def listar_pedidos(self, limit: int, after: Optional[str] = None,
+                             filtro: Optional[PedidoFiltroSchema] = None) -> PaginaPedidoSchema:
+        try:
+            after_id = decode_cursor(after)
+            PedidoService.validate_filtro(filtro)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        pedidos, proximo = await self.service.read_pedidos_page(limit, after_id, filtro)
+        return PaginaPedidoSchema(itens=[PedidoOutSchema.model_validate(x) for x in pedidos],
+                                  next=encode_cursor(proximo))
+
+    async def listar_pedidos_json(self, limit: int, after: Optional[str] = None,
+                                  filtro: Optional[PedidoFiltroSchema] = None) -> dict:
+        # Mesma página de listar_pedidos, já como dict para RespostaJSON
+        try:
+            after_id = decode_cursor(after)
+            PedidoService.validate_filtro(filtro)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        pedidos, proximo = await self.service.read_pedidos_page(limit, after_id, filtro)
+        return {"itens": [pedido_dict(x) for x in pedidos], "next": encode_cursor(proximo)}
+
+    async def etag_pedido(self, pedido_id: int) -> str:
+        try:
+            versao = await self.service.read_pedido_version(pedido_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        return etag_recurso("pedido", pedido_id, versao)
+
+    async def etag_pagina_pedidos(self, limit: int, after: Optional[str] = None,
+                                  filtro: Optional[PedidoFiltroSchema] = None) -> str:
+        try:
+            after_id = decode_cursor(after)
+            PedidoService.validate_filtro(filtro)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        pares, proximo = await self.service.read_pedidos_page_versions(limit, after_id, filtro)
+        return etag_pagina("pedido", pares, encode_cursor(proximo))
+
+    def exportar_pedidos(self, formato: str, data_inicio: Optional[date] = None,
+                         data_fim: Optional[date] = None) -> AsyncIterator[str]:
+        return em_blocos_async(self.service.stream_pedidos(data_inicio, data_fim), formato)
+
+    async def ler_pedido(self, pedido_id: int) -> PedidoOutSchema:
+        try:
+            return PedidoOutSchema.model_validate(await self.service.read_pedido_by_id(pedido_id))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    async def criar_pedido(self, pedido_data: PedidoCreateSchema) -> PedidoOutSchema:
+        try:
+            return PedidoOutSchema.model_validate(await self.service.create_pedido(pedido_data))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def criar_pedidos_lote(self, lote: PedidoBatchSchema) -> PedidoBatchOutSchema:
+        try:
+            resultados = await self.service.create_pedidos_batch(lote.pedidos)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        criados = sum(1 for r in resultados if r["id"] is not None)
+        return PedidoBatchOutSchema(criados=criados, rejeitados=len(resultados) - criados,
+                                    resultados=resultados)
+
+    async def atualizar_pedido(self, pedido_id: int, update_data: PedidoUpdateSchema) -> PedidoOutSchema:
+        try:
+            return PedidoOutSchema.model_validate(await self.service.update_pedido(pedido_id, update_data))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    async def deletar_pedido(self, pedido_id: int) -> None:
+        try:
+            await self.service.delete_pedido(pedido_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,37 @@
+from fastapi import HTTPException, status
+from services.async_relatorio_service import AsyncRelatorioService
+from schemas.schema import TotalPedidoSchema, ReceitaDiaSchema, ReceitaClienteSchema, ProdutoVendidoSchema
+from datetime import date
+from typing import List, Optional
+
+class AsyncRelatorioController:
+    def __init__(self, service: AsyncRelatorioService):
+        self.service = service
+
+    async def total_pedido(self, pedido_id: int) -> TotalPedidoSchema:
+        try:
+            return TotalPedidoSchema(**await self.service.read_pedido_total(pedido_id))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    async def receita_por_dia(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> List[ReceitaDiaSchema]:
+        try:
+            return [ReceitaDiaSchema(**linha) for linha in await self.service.read_revenue_by_day(data_inicio, data_fim)]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def receita_por_cliente(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                                  limit: int = 50) -> List[ReceitaClienteSchema]:
+        try:
+            linhas = await self.service.read_revenue_by_client(data_inicio, data_fim, limit)
+            return [ReceitaClienteSchema(**linha) for linha in linhas]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def produtos_mais_vendidos(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                                     limit: int = 10) -> List[ProdutoVendidoSchema]:
+        try:
+            linhas = await self.service.read_top_products(data_inicio, data_fim, limit)
+            return [ProdutoVendidoSchema(**linha) for linha in linhas]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,31 +1,64 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from services.cliente_service import ClienteService
-from schemas.schema import ClienteCreateSchema, ClienteUpdateSchema, ClienteOutSchema
-from typing import List
+from controllers.cursor import encode_cursor, decode_cursor
+from controllers.etag import etag_recurso, etag_pagina
+from controllers.serializacao import cliente_dict
+from schemas.schema import ClienteCreateSchema, ClienteUpdateSchema, ClienteOutSchema, PaginaClienteSchema
+from typing import Optional
 
 class ClienteController:
     def __init__(self, service: ClienteService):
         self.service = service
 
-    def listar_clientes(self) -> List[ClienteOutSchema]:
-        return self.service.read_all_clientes()
+    def listar_clientes(self, limit: int, after: Optional[str] = None) -> PaginaClienteSchema:
+        try:
+            after_id = decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        clientes, proximo = self.service.read_clientes_page(limit, after_id)
+        return PaginaClienteSchema(itens=[ClienteOutSchema.model_validate(x) for x in clientes],
+                                   next=encode_cursor(proximo))
+
+    def listar_clientes_json(self, limit: int, after: Optional[str] = None) -> dict:
+        # Mesma página de listar_clientes, já como dict para RespostaJSON
+        try:
+            after_id = decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        clientes, proximo = self.service.read_clientes_page(limit, after_id)
+        return {"itens": [cliente_dict(x) for x in clientes], "next": encode_cursor(proximo)}
+
+    def etag_cliente(self, cliente_id: int) -> str:
+        try:
+            versao = self.service.read_cliente_version(cliente_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        return etag_recurso("cliente", cliente_id, versao)
+
+    def etag_pagina_clientes(self, limit: int, after: Optional[str] = None) -> str:
+        try:
+            after_id = decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        pares, proximo = self.service.read_clientes_page_versions(limit, after_id)
+        return etag_pagina("cliente", pares, encode_cursor(proximo))
 
     def ler_cliente(self, cliente_id: int) -> ClienteOutSchema:
         try:
-            return self.service.read_cliente_by_id(cliente_id)
+            return ClienteOutSchema.model_validate(self.service.read_cliente_by_id(cliente_id))
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     def criar_cliente(self, cliente_data: ClienteCreateSchema) -> ClienteOutSchema:
         try:
-            return self.service.create_cliente(cliente_data)
+            return ClienteOutSchema.model_validate(self.service.create_cliente(cliente_data))
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     def atualizar_cliente(self, cliente_id: int, update_data: ClienteUpdateSchema) -> ClienteOutSchema:
         try:
-            return self.service.update_cliente(cliente_id, update_data)
+            return ClienteOutSchema.model_validate(self.service.update_cliente(cliente_id, update_data))
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
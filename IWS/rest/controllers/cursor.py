@@ -0,0 +1,19 @@
+import base64
+from typing import Optional
+
+# Cursor opaco para paginação: o cliente só devolve o valor recebido em "next",
+# sem depender de como a chave é representada internamente
+
+def encode_cursor(ultimo_id: Optional[int]) -> Optional[str]:
+    if ultimo_id is None:
+        return None
+    return base64.urlsafe_b64encode(str(ultimo_id).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(cursor + padding).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Cursor inválido")
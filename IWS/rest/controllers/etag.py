@@ -0,0 +1,22 @@
+import hashlib
+from typing import Iterable, Optional, Tuple
+
+# ETags derivados da coluna "versao" (version_id_col) dos modelos: mudam a cada
+# UPDATE feito pelo ORM e podem ser conferidos sem carregar nem serializar o recurso
+
+def etag_recurso(tipo: str, recurso_id: int, versao: int) -> str:
+    return f'"{tipo}-{recurso_id}-{versao}"'
+
+def etag_pagina(tipo: str, pares: Iterable[Tuple[int, int]], proximo: Optional[str]) -> str:
+    conteudo = ";".join(f"{recurso_id}:{versao}" for recurso_id, versao in pares)
+    digest = hashlib.sha1(f"{conteudo}|{proximo}".encode()).hexdigest()[:20]
+    return f'"{tipo}s-{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Comparação fraca (RFC 9110): ignora o prefixo W/
+    candidatos = (valor.strip().removeprefix("W/") for valor in if_none_match.split(","))
+    return etag in candidatos
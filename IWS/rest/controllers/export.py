@@ -0,0 +1,52 @@
+import csv
+import io
+from controllers.serializacao import dumps
+
+# Formatos de GET /pedidos/export. Os pedidos chegam um a um (já agrupados
+# com seus itens) e são enviados em blocos, para não fazer uma escrita por linha
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+CSV_COLUNAS = ["pedido_id", "cliente", "data_pedido", "item_id", "produto", "quantidade", "preco"]
+PEDIDOS_POR_BLOCO = 500
+
+def linha_ndjson(pedido: dict) -> str:
+    return dumps(pedido).decode("utf-8") + "\n"
+
+def linhas_csv(pedido: dict) -> str:
+    # Uma linha por item; pedido sem itens gera uma linha com as colunas do item vazias
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for item in pedido["itens"] or [{}]:
+        writer.writerow([pedido["id"], pedido["cliente"], pedido["data_pedido"], item.get("id"),
+                         item.get("produto"), item.get("quantidade"), item.get("preco")])
+    return buffer.getvalue()
+
+def cabecalho(formato: str) -> str:
+    if formato == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(CSV_COLUNAS)
+        return buffer.getvalue()
+    return ""
+
+FORMATADORES = {"ndjson": linha_ndjson, "csv": linhas_csv}
+
+def em_blocos(pedidos, formato: str):
+    formatar = FORMATADORES[formato]
+    bloco = [cabecalho(formato)]
+    for pedido in pedidos:
+        bloco.append(formatar(pedido))
+        if len(bloco) >= PEDIDOS_POR_BLOCO:
+            yield "".join(bloco)
+            bloco = []
+    if bloco:
+        yield "".join(bloco)
+
+async def em_blocos_async(pedidos, formato: str):
+    formatar = FORMATADORES[formato]
+    bloco = [cabecalho(formato)]
+    async for pedido in pedidos:
+        bloco.append(formatar(pedido))
+        if len(bloco) >= PEDIDOS_POR_BLOCO:
+            yield "".join(bloco)
+            bloco = []
+    if bloco:
+        yield "".join(bloco)
@@ -1,10 +1,23 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from repositories.pedido_repository import PedidoRepository
 from repositories.cliente_repository import ClienteRepository
+from repositories.async_pedido_repository import AsyncPedidoRepository
+from repositories.async_cliente_repository import AsyncClienteRepository
+from repositories.relatorio_repository import RelatorioRepository
+from repositories.async_relatorio_repository import AsyncRelatorioRepository
 from services.pedido_service import PedidoService
 from services.cliente_service import ClienteService
+from services.async_pedido_service import AsyncPedidoService
+from services.async_cliente_service import AsyncClienteService
+from services.relatorio_service import RelatorioService
+from services.async_relatorio_service import AsyncRelatorioService
 from controllers.pedido_controller import PedidoController
 from controllers.cliente_controller import ClienteController
+from controllers.async_pedido_controller import AsyncPedidoController
+from controllers.async_cliente_controller import AsyncClienteController
+from controllers.relatorio_controller import RelatorioController
+from controllers.async_relatorio_controller import AsyncRelatorioController
 
 class ControllerFactory:
     
@@ -19,4 +32,28 @@ class ControllerFactory:
         repository = ClienteRepository(db)
         service = ClienteService(repository)
         return ClienteController(service)
+
+    @staticmethod
+    def create_relatorio_controller(db: Session) -> RelatorioController:
+        repository = RelatorioRepository(db)
+        service = RelatorioService(repository)
+        return RelatorioController(service)
+
+    @staticmethod
+    def create_async_pedido_controller(db: AsyncSession) -> AsyncPedidoController:
+        repository = AsyncPedidoRepository(db)
+        service = AsyncPedidoService(repository)
+        return AsyncPedidoController(service)
+
+    @staticmethod
+    def create_async_cliente_controller(db: AsyncSession) -> AsyncClienteController:
+        repository = AsyncClienteRepository(db)
+        service = AsyncClienteService(repository)
+        return AsyncClienteController(service)
+
+    @staticmethod
+    def create_async_relatorio_controller(db: AsyncSession) -> AsyncRelatorioController:
+        repository = AsyncRelatorioRepository(db)
+        service = AsyncRelatorioService(repository)
+        return AsyncRelatorioController(service)
     
\ No newline at end of file
@@ -0,0 +1,37 @@
+from fastapi import HTTPException, status
+from services.relatorio_service import RelatorioService
+from schemas.schema import TotalPedidoSchema, ReceitaDiaSchema, ReceitaClienteSchema, ProdutoVendidoSchema
+from datetime import date
+from typing import List, Optional
+
+class RelatorioController:
+    def __init__(self, service: RelatorioService):
+        self.service = service
+
+    def total_pedido(self, pedido_id: int) -> TotalPedidoSchema:
+        try:
+            return TotalPedidoSchema(**self.service.read_pedido_total(pedido_id))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    def receita_por_dia(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> List[ReceitaDiaSchema]:
+        try:
+            return [ReceitaDiaSchema(**linha) for linha in self.service.read_revenue_by_day(data_inicio, data_fim)]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def receita_por_cliente(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                            limit: int = 50) -> List[ReceitaClienteSchema]:
+        try:
+            linhas = self.service.read_revenue_by_client(data_inicio, data_fim, limit)
+            return [ReceitaClienteSchema(**linha) for linha in linhas]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def produtos_mais_vendidos(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                               limit: int = 10) -> List[ProdutoVendidoSchema]:
+        try:
+            linhas = self.service.read_top_products(data_inicio, data_fim, limit)
+            return [ProdutoVendidoSchema(**linha) for linha in linhas]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,42 @@
+import json
+from decimal import Decimal
+from starlette.responses import Response
+
+# Caminho rápido para respostas grandes: os objetos do ORM viram dicts
+# diretamente (sem model_validate nem a validação do response_model do FastAPI)
+# e são codificados com orjson, quando instalado
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _default(valor):
+    # Decimal sai como string ("10.50"), igual à serialização do Pydantic
+    if isinstance(valor, Decimal):
+        return str(valor)
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+if orjson is not None:
+    def dumps(conteudo) -> bytes:
+        return orjson.dumps(conteudo, default=_default)
+else:
+    def dumps(conteudo) -> bytes:
+        return json.dumps(conteudo, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class RespostaJSON(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+def item_dict(item) -> dict:
+    return {"produto": item.produto, "quantidade": item.quantidade, "preco": item.preco, "id": item.id}
+
+def pedido_dict(pedido) -> dict:
+    # Mesmos campos de PedidoOutSchema
+    return {"id": pedido.id, "cliente": pedido.cliente, "data_pedido": pedido.data_pedido,
+            "versao": pedido.versao, "itens": [item_dict(item) for item in pedido.itens]}
+
+def cliente_dict(cliente) -> dict:
+    # Mesmos campos de ClienteOutSchema
+    return {"nome": cliente.nome, "idade": cliente.idade, "id": cliente.id, "versao": cliente.versao}
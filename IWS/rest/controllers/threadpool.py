@@ -0,0 +1,16 @@
+from fastapi.concurrency import run_in_threadpool
+
+class ThreadpoolController:
+    # Adapta um controlador síncrono às rotas async def: cada método vira uma
+    # corrotina executada no threadpool, como o FastAPI faria com uma rota def.
+    # Os controladores síncronos já devolvem schemas, então nenhum acesso ao
+    # banco (lazy loading) acontece depois, no event loop.
+    def __init__(self, controller):
+        self.controller = controller
+
+    def __getattr__(self, nome):
+        metodo = getattr(self.controller, nome)
+
+        async def executar(*args, **kwargs):
+            return await run_in_threadpool(metodo, *args, **kwargs)
+        return executar
@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+from config.database import get_engine, get_async_engine
+from config.settings import get_settings
+from models.base import Base
+# Registra todos os modelos no metadata antes do create_all
+from models.cliente import Cliente
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+
+# Comandos de administração, executados à parte do servidor:
+#   python manage.py create-schema
+
+async def create_schema_async():
+    engine = get_async_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+def create_schema():
+    # Cria as tabelas que ainda não existem, no banco do modo configurado
+    if get_settings().db_async:
+        asyncio.run(create_schema_async())
+    else:
+        Base.metadata.create_all(bind=get_engine())
+    print("Esquema criado")
+
+COMMANDS = {"create-schema": create_schema}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Administração da API de pedidos")
+    parser.add_argument("command", choices=COMMANDS)
+    args = parser.parse_args()
+    COMMANDS[args.command]()
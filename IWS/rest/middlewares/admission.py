@@ -0,0 +1,89 @@
+import asyncio
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from config.settings import get_admission_settings
+from middlewares.metrics import registry
+
+class Limitador:
+    # Até "limite" requisições simultâneas; acima disso até "fila" esperam por
+    # uma vaga e as demais são recusadas na hora
+    def __init__(self, limite: int, fila: int):
+        self.limite = limite
+        self.fila = fila
+        self.semaforo = asyncio.Semaphore(limite)
+        self.aguardando = 0
+
+    async def entrar(self, espera: float) -> str:
+        # Devolve "admitted", "queued" (admitida depois de esperar) ou "shed"
+        if not self.semaforo.locked():
+            await self.semaforo.acquire()
+            return "admitted"
+        if self.aguardando >= self.fila:
+            return "shed"
+        self.aguardando += 1
+        try:
+            await asyncio.wait_for(self.semaforo.acquire(), espera)
+            return "queued"
+        except asyncio.TimeoutError:
+            return "shed"
+        finally:
+            self.aguardando -= 1
+
+    def sair(self):
+        self.semaforo.release()
+
+# Um limitador por rota configurada, criado no primeiro uso (no loop do worker)
+limitadores = {}
+
+def rotas_limitadas(app):
+    # Só as rotas com limite configurado, calculadas uma vez por aplicação
+    rotas = getattr(app.state, "rotas_limitadas", None)
+    if rotas is None:
+        limites = get_admission_settings().limits
+        rotas = [rota for rota in app.router.routes
+                 if any((metodo, getattr(rota, "path", None)) in limites
+                        for metodo in getattr(rota, "methods", None) or ())]
+        app.state.rotas_limitadas = rotas
+    return rotas
+
+def rota_da_requisicao(request: Request):
+    for rota in rotas_limitadas(request.app):
+        if request.method not in rota.methods:
+            continue
+        match, _ = rota.matches(request.scope)
+        if match == Match.FULL:
+            return rota
+    return None
+
+def limitador_da_rota(method: str, caminho: str):
+    limite = get_admission_settings().limits.get((method, caminho))
+    if limite is None:
+        return None
+    if (method, caminho) not in limitadores:
+        limitadores[(method, caminho)] = Limitador(*limite)
+    return limitadores[(method, caminho)]
+
+async def admission_middleware(request: Request, call_next):
+    # Sem limites configurados (o padrão) não há nada a verificar
+    if not get_admission_settings().limits:
+        return await call_next(request)
+    rota = rota_da_requisicao(request)
+    limitador = limitador_da_rota(request.method, rota.path) if rota is not None else None
+    if limitador is None:
+        return await call_next(request)
+    # Registra a rota já aqui para que as métricas identifiquem as recusadas
+    request.scope["route"] = rota
+    settings = get_admission_settings()
+    resultado = await limitador.entrar(settings.queue_timeout)
+    registry.observe_admission(request.method, rota.path, resultado)
+    if resultado == "shed":
+        # Recusa rápida: melhor que deixar a requisição esperar por uma conexão
+        # do pool até o timeout, atrasando também as outras rotas
+        return JSONResponse({"detail": "Servidor sobrecarregado, tente novamente"}, status_code=503,
+                            headers={"Retry-After": str(settings.retry_after)})
+    try:
+        # A vaga é liberada quando a resposta começa a ser enviada
+        return await call_next(request)
+    finally:
+        limitador.sair()
@@ -0,0 +1,152 @@
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+from sqlalchemy import event
+from starlette.requests import Request
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, valor: float):
+        self.counts[bisect_left(self.buckets, valor)] += 1
+        self.total += valor
+        self.count += 1
+
+class MetricsRegistry:
+    # Histogramas e contadores em memória, por processo, expostos em /metrics
+    # no formato texto do Prometheus
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.request_latency = {}
+        self.request_status = {}
+        self.query_latency = {}
+        self.queries_per_request = {}
+        self.admission = {}
+
+    def observe_request(self, method: str, route: str, status: int, duracao: float, consultas: int):
+        with self.lock:
+            chave = (method, route)
+            self.request_latency.setdefault(chave, Histogram(LATENCY_BUCKETS)).observe(duracao)
+            self.queries_per_request.setdefault(chave, Histogram(QUERY_COUNT_BUCKETS)).observe(consultas)
+            chave_status = (method, route, str(status))
+            self.request_status[chave_status] = self.request_status.get(chave_status, 0) + 1
+
+    def observe_admission(self, method: str, route: str, resultado: str):
+        # Um resultado por requisição: "admitted" (sem espera), "queued"
+        # (admitida depois de esperar na fila) ou "shed" (503)
+        with self.lock:
+            chave = (method, route, resultado)
+            self.admission[chave] = self.admission.get(chave, 0) + 1
+
+    def observe_query(self, operacao: str, duracao: float):
+        with self.lock:
+            self.query_latency.setdefault((operacao,), Histogram(LATENCY_BUCKETS)).observe(duracao)
+
+    def render(self, gauges: dict = None) -> str:
+        linhas = []
+        with self.lock:
+            self._render_histograms(linhas, "http_request_duration_seconds", "Latência das requisições por rota",
+                                    ("method", "route"), self.request_latency)
+            linhas.append("# HELP http_requests_total Requisições por rota e status")
+            linhas.append("# TYPE http_requests_total counter")
+            for chave, total in sorted(self.request_status.items()):
+                linhas.append(f"http_requests_total{_labels(('method', 'route', 'status'), chave)} {total}")
+            linhas.append("# HELP http_admission_total Controle de admissão por rota")
+            linhas.append("# TYPE http_admission_total counter")
+            for chave, total in sorted(self.admission.items()):
+                linhas.append(f"http_admission_total{_labels(('method', 'route', 'result'), chave)} {total}")
+            self._render_histograms(linhas, "db_queries_per_request", "Consultas SQL por requisição",
+                                    ("method", "route"), self.queries_per_request)
+            self._render_histograms(linhas, "db_query_duration_seconds", "Duração das consultas SQL",
+                                    ("operation",), self.query_latency)
+        for nome, valor in (gauges or {}).items():
+            linhas.append(f"# TYPE {nome} gauge")
+            linhas.append(f"{nome} {valor}")
+        return "\n".join(linhas) + "\n"
+
+    @staticmethod
+    def _render_histograms(linhas, nome, ajuda, nomes_labels, histogramas):
+        linhas.append(f"# HELP {nome} {ajuda}")
+        linhas.append(f"# TYPE {nome} histogram")
+        for chave, histograma in sorted(histogramas.items()):
+            acumulado = 0
+            for limite, quantidade in zip(histograma.buckets + ("+Inf",), histograma.counts):
+                acumulado += quantidade
+                labels = _labels(nomes_labels + ("le",), chave + (str(limite),))
+                linhas.append(f"{nome}_bucket{labels} {acumulado}")
+            labels = _labels(nomes_labels, chave)
+            linhas.append(f"{nome}_sum{labels} {histograma.total}")
+            linhas.append(f"{nome}_count{labels} {histograma.count}")
+
+def _labels(nomes, valores) -> str:
+    pares = ",".join(f'{nome}="{valor}"' for nome, valor in zip(nomes, valores))
+    return "{" + pares + "}"
+
+registry = MetricsRegistry()
+
+class ContadorConsultas:
+    def __init__(self):
+        self.total = 0
+
+# Contador da requisição atual. Guarda um objeto mutável: as consultas feitas
+# no threadpool rodam numa cópia do contexto, mas incrementam o mesmo objeto
+consultas_da_requisicao = contextvars.ContextVar("consultas_da_requisicao", default=None)
+
+def _antes_da_consulta(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _erro_na_consulta(exception_context):
+    # after_cursor_execute não é chamado quando a consulta falha: sem isso o
+    # início dela ficaria na conexão (que volta ao pool) para sempre
+    conn = exception_context.connection
+    if conn is not None and exception_context.cursor is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+def _depois_da_consulta(conn, cursor, statement, parameters, context, executemany):
+    duracao = time.perf_counter() - conn.info["query_start"].pop()
+    operacao = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+    registry.observe_query(operacao, duracao)
+    contador = consultas_da_requisicao.get()
+    if contador is not None:
+        contador.total += 1
+    limite_ms = get_settings().slow_query_ms
+    if limite_ms and duracao * 1000 >= limite_ms:
+        logger.warning("Consulta lenta (%.1f ms): %s", duracao * 1000, statement)
+
+def instrument_engine(engine):
+    # Aceita Engine ou AsyncEngine (os eventos ficam no sync_engine); chamar de
+    # novo para o mesmo engine não duplica a contagem
+    engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(engine, "before_cursor_execute", _antes_da_consulta):
+        event.listen(engine, "before_cursor_execute", _antes_da_consulta)
+        event.listen(engine, "after_cursor_execute", _depois_da_consulta)
+        event.listen(engine, "handle_error", _erro_na_consulta)
+
+async def metrics_middleware(request: Request, call_next):
+    contador = ContadorConsultas()
+    token = consultas_da_requisicao.set(contador)
+    inicio = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Usa o caminho declarado da rota (ex.: /pedidos/{pedido_id}) para não
+        # criar uma série por id; requisições sem rota ficam como "unmatched"
+        rota = request.scope.get("route")
+        nome_rota = rota.path if rota is not None else "unmatched"
+        registry.observe_request(request.method, nome_rota, status, time.perf_counter() - inicio, contador.total)
+        consultas_da_requisicao.reset(token)
@@ -0,0 +1,30 @@
+import time
+from starlette.requests import Request
+from config.database import has_read_replica
+from config.settings import get_settings
+
+# Leitura das próprias escritas: a réplica pode estar alguns segundos atrás do
+# principal. Depois de uma escrita bem-sucedida o cliente recebe um cookie com
+# o instante até o qual suas leituras vão para o principal. Por ser guardado no
+# cliente, vale para qualquer worker.
+# Com dois arquivos SQLite (DATABASE_URL e READ_DATABASE_URL) não há replicação:
+# um pedido criado só aparece no GET enquanto o cookie valer, o que permite
+# conferir o roteamento localmente
+COOKIE_LEITURA = "ler_do_principal_ate"
+METODOS_ESCRITA = {"POST", "PUT", "PATCH", "DELETE"}
+
+def ler_do_principal(request: Request) -> bool:
+    if not has_read_replica():
+        return True
+    try:
+        return float(request.cookies.get(COOKIE_LEITURA, 0)) > time.time()
+    except ValueError:
+        return False
+
+async def read_your_writes_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method in METODOS_ESCRITA and response.status_code < 400 and has_read_replica():
+        segundos = get_settings().read_your_writes_seconds
+        response.set_cookie(COOKIE_LEITURA, str(time.time() + segundos), max_age=segundos,
+                            httponly=True, samesite="lax")
+    return response
@@ -6,3 +6,7 @@ class Cliente(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     nome = Column(String(100))
     idade = Column(Integer)
+    # Incrementada pelo ORM a cada UPDATE; usada para gerar o ETag do cliente
+    versao = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": versao}
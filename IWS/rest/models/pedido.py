@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy.orm import relationship
+from datetime import date
+from .base import Base
+
+class Pedido(Base):
+    __tablename__ = 'pedido'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cliente = Column(String(100), index=True)
+    data_pedido = Column(Date, default=date.today, index=True)
+    # Incrementada pelo ORM a cada UPDATE; usada para gerar o ETag do pedido
+    versao = Column(Integer, nullable=False, default=1, server_default="1")
+    # passive_deletes: ao excluir um pedido, os itens são removidos pelo
+    # ON DELETE CASCADE do banco, sem carregá-los
+    itens = relationship("ItemPedido", back_populates="pedido", cascade="all, delete-orphan",
+                         passive_deletes=True)
+
+    __mapper_args__ = {"version_id_col": versao}
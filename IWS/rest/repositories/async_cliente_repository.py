@@ -0,0 +1,76 @@
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.cliente import Cliente
+from typing import List, Optional, Tuple
+
+class AsyncClienteRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, cliente: Cliente) -> Cliente:
+        try:
+            self.db.add(cliente)
+            await self.db.commit()
+            return cliente
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao criar cliente: {str(e)}")
+
+    async def read_by_id(self, cliente_id: int) -> Cliente:
+        try:
+            return await self.db.get(Cliente, cliente_id)
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler cliente: {str(e)}")
+
+    async def read_all(self) -> List[Cliente]:
+        try:
+            result = await self.db.execute(select(Cliente))
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar clientes: {str(e)}")
+
+    async def read_page(self, limit: int, after: Optional[int] = None) -> List[Cliente]:
+        try:
+            query = select(Cliente)
+            if after is not None:
+                query = query.where(Cliente.id > after)
+            result = await self.db.execute(query.order_by(Cliente.id).limit(limit))
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar clientes: {str(e)}")
+
+    async def read_version(self, cliente_id: int) -> Optional[int]:
+        try:
+            return await self.db.scalar(select(Cliente.versao).where(Cliente.id == cliente_id))
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler cliente: {str(e)}")
+
+    async def read_page_versions(self, limit: int, after: Optional[int] = None) -> List[Tuple[int, int]]:
+        try:
+            query = select(Cliente.id, Cliente.versao)
+            if after is not None:
+                query = query.where(Cliente.id > after)
+            result = await self.db.execute(query.order_by(Cliente.id).limit(limit))
+            return [tuple(linha) for linha in result.all()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar clientes: {str(e)}")
+
+    async def update(self, cliente: Cliente) -> Cliente:
+        try:
+            await self.db.commit()
+            return cliente
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao atualizar cliente: {str(e)}")
+
+    async def delete(self, cliente_id: int) -> None:
+        try:
+            cliente = await self.read_by_id(cliente_id)
+            if not cliente:
+                raise ValueError("Cliente não encontrado")
+            await self.db.delete(cliente)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao deletar cliente: {str(e)}")
@@ -0,0 +1,119 @@
+from sqlalchemy import delete, select, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from repositories.loading import loader_option
+from repositories.pedido_repository import export_query, filtrar_pedidos
+from schemas.schema import PedidoFiltroSchema
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+
+class AsyncPedidoRepository:
+    def __init__(self, db: AsyncSession, loading: str = "selectin"):
+        # Com AsyncSession não há lazy loading implícito: os itens precisam
+        # ser carregados junto com o pedido
+        if loading == "lazy":
+            raise ValueError("O modo assíncrono exige carregamento antecipado dos itens")
+        self.db = db
+        self.itens_option = loader_option(Pedido.itens, loading)
+
+    async def create(self, pedido: Pedido) -> Pedido:
+        # Com expire_on_commit=False, id e itens já estão preenchidos após o
+        # flush, sem precisar de refresh
+        try:
+            self.db.add(pedido)
+            await self.db.commit()
+            return pedido
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao criar pedido: {str(e)}")
+
+    async def create_many(self, pedidos: List[dict]) -> List[int]:
+        try:
+            dialect = self.db.get_bind().dialect
+            linhas = [{"cliente": p["cliente"], "data_pedido": p["data_pedido"]} for p in pedidos]
+            if dialect.insert_executemany_returning_sort_by_parameter_order:
+                result = await self.db.scalars(insert(Pedido).returning(Pedido.id, sort_by_parameter_order=True),
+                                               linhas)
+                ids = result.all()
+            else:
+                ids = [(await self.db.execute(insert(Pedido).values(**linha))).inserted_primary_key[0]
+                       for linha in linhas]
+            itens = [dict(item, pedido_id=pedido_id)
+                     for pedido_id, pedido in zip(ids, pedidos) for item in pedido["itens"]]
+            if itens:
+                await self.db.execute(insert(ItemPedido), itens)
+            await self.db.commit()
+            return list(ids)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao criar pedidos: {str(e)}")
+
+    async def read_by_id(self, pedido_id: int) -> Pedido:
+        try:
+            return await self.db.get(Pedido, pedido_id, options=[selectinload(Pedido.itens)])
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler pedido: {str(e)}")
+
+    async def read_all(self) -> List[Pedido]:
+        try:
+            result = await self.db.execute(select(Pedido).options(self.itens_option))
+            return result.unique().scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    async def read_page(self, limit: int, after: Optional[int] = None,
+                        filtro: Optional[PedidoFiltroSchema] = None) -> List[Pedido]:
+        try:
+            query = filtrar_pedidos(select(Pedido).options(self.itens_option), filtro)
+            if after is not None:
+                query = query.where(Pedido.id > after)
+            result = await self.db.execute(query.order_by(Pedido.id).limit(limit))
+            return result.unique().scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    async def stream_rows(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> AsyncIterator:
+        try:
+            result = await self.db.stream(export_query(data_inicio, data_fim))
+            async for linha in result:
+                yield linha
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao exportar pedidos: {str(e)}")
+
+    async def read_version(self, pedido_id: int) -> Optional[int]:
+        try:
+            return await self.db.scalar(select(Pedido.versao).where(Pedido.id == pedido_id))
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler pedido: {str(e)}")
+
+    async def read_page_versions(self, limit: int, after: Optional[int] = None,
+                                 filtro: Optional[PedidoFiltroSchema] = None) -> List[Tuple[int, int]]:
+        try:
+            query = filtrar_pedidos(select(Pedido.id, Pedido.versao), filtro)
+            if after is not None:
+                query = query.where(Pedido.id > after)
+            result = await self.db.execute(query.order_by(Pedido.id).limit(limit))
+            return [tuple(linha) for linha in result.all()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    async def update(self, pedido: Pedido) -> Pedido:
+        try:
+            await self.db.commit()
+            return pedido
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
+
+    async def delete(self, pedido_id: int) -> None:
+        try:
+            resultado = await self.db.execute(delete(Pedido).where(Pedido.id == pedido_id))
+            await self.db.commit()
+            if resultado.rowcount == 0:
+                raise ValueError("Pedido não encontrado")
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise ValueError(f"Erro ao deletar pedido: {str(e)}")
@@ -0,0 +1,40 @@
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.relatorio_repository import (total_pedido_query, receita_por_dia_query,
+                                               receita_por_cliente_query, top_produtos_query)
+from datetime import date
+from typing import List, Optional
+
+class AsyncRelatorioRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def order_total(self, pedido_id: int) -> Optional[dict]:
+        try:
+            linha = (await self.db.execute(total_pedido_query(pedido_id))).mappings().first()
+            return dict(linha) if linha else None
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular total do pedido: {str(e)}")
+
+    async def revenue_by_day(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> List[dict]:
+        try:
+            result = await self.db.execute(receita_por_dia_query(data_inicio, data_fim))
+            return [dict(linha) for linha in result.mappings()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular receita por dia: {str(e)}")
+
+    async def revenue_by_client(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                                limit: int = 50) -> List[dict]:
+        try:
+            result = await self.db.execute(receita_por_cliente_query(data_inicio, data_fim, limit))
+            return [dict(linha) for linha in result.mappings()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular receita por cliente: {str(e)}")
+
+    async def top_products(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                           limit: int = 10) -> List[dict]:
+        try:
+            result = await self.db.execute(top_produtos_query(data_inicio, data_fim, limit))
+            return [dict(linha) for linha in result.mappings()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular produtos mais vendidos: {str(e)}")
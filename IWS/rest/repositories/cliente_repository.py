@@ -0,0 +1,73 @@
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from models.cliente import Cliente
+from typing import List, Optional, Tuple
+
+class ClienteRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, cliente: Cliente) -> Cliente:
+        try:
+            self.db.add(cliente)
+            self.db.commit()
+            return cliente
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao criar cliente: {str(e)}")
+
+    def read_by_id(self, cliente_id: int) -> Cliente:
+        try:
+            return self.db.get(Cliente, cliente_id)
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler cliente: {str(e)}")
+
+    def read_all(self) -> List[Cliente]:
+        try:
+            return self.db.query(Cliente).all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar clientes: {str(e)}")
+
+    def read_page(self, limit: int, after: Optional[int] = None) -> List[Cliente]:
+        try:
+            query = self.db.query(Cliente)
+            if after is not None:
+                query = query.filter(Cliente.id > after)
+            return query.order_by(Cliente.id).limit(limit).all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar clientes: {str(e)}")
+
+    def read_version(self, cliente_id: int) -> Optional[int]:
+        # Consulta só a versão, sem carregar o cliente (usada na validação do ETag)
+        try:
+            return self.db.query(Cliente.versao).filter(Cliente.id == cliente_id).scalar()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler cliente: {str(e)}")
+
+    def read_page_versions(self, limit: int, after: Optional[int] = None) -> List[Tuple[int, int]]:
+        try:
+            query = self.db.query(Cliente.id, Cliente.versao)
+            if after is not None:
+                query = query.filter(Cliente.id > after)
+            return [tuple(linha) for linha in query.order_by(Cliente.id).limit(limit).all()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar clientes: {str(e)}")
+
+    def update(self, cliente: Cliente) -> Cliente:
+        try:
+            self.db.commit()
+            return cliente
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao atualizar cliente: {str(e)}")
+
+    def delete(self, cliente_id: int) -> None:
+        try:
+            cliente = self.read_by_id(cliente_id)
+            if not cliente:
+                raise ValueError("Cliente não encontrado")
+            self.db.delete(cliente)
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao deletar cliente: {str(e)}")
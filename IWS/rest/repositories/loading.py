@@ -0,0 +1,17 @@
+from sqlalchemy.orm import selectinload, joinedload, lazyload
+
+# Estratégias de carregamento da relação Pedido.itens.
+# "selectin" carrega os itens de todos os pedidos da página em um único
+# SELECT ... WHERE pedido_id IN (...); "joined" usa um LEFT OUTER JOIN na
+# mesma consulta; "lazy" mantém o comportamento padrão (um SELECT por pedido).
+LOADING_STRATEGIES = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "lazy": lazyload,
+}
+
+def loader_option(relationship, strategy: str):
+    try:
+        return LOADING_STRATEGIES[strategy](relationship)
+    except KeyError:
+        raise ValueError(f"Estratégia de carregamento inválida: {strategy}")
@@ -0,0 +1,147 @@
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from repositories.loading import loader_option
+from datetime import date
+from typing import Iterator, List, Optional, Tuple
+from schemas.schema import PedidoFiltroSchema
+
+# Linhas buscadas por vez do cursor do servidor na exportação
+EXPORT_BATCH_SIZE = 1000
+
+def export_query(data_inicio: Optional[date] = None, data_fim: Optional[date] = None):
+    # Uma única consulta (pedido LEFT JOIN item_pedido) em ordem de pedido, para
+    # ler em streaming sem consultas extras por pedido: com cursor no servidor o
+    # MySQL não aceita outra consulta na mesma conexão até o fim da leitura
+    query = (select(Pedido.id.label("pedido_id"), Pedido.cliente, Pedido.data_pedido,
+                    ItemPedido.id.label("item_id"), ItemPedido.produto, ItemPedido.quantidade, ItemPedido.preco)
+             .outerjoin(ItemPedido, ItemPedido.pedido_id == Pedido.id))
+    if data_inicio is not None:
+        query = query.where(Pedido.data_pedido >= data_inicio)
+    if data_fim is not None:
+        query = query.where(Pedido.data_pedido <= data_fim)
+    return query.order_by(Pedido.id, ItemPedido.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+def filtrar_pedidos(query, filtro: Optional[PedidoFiltroSchema]):
+    # Cada filtro tem um índice próprio (ver models): igualdade em cliente,
+    # intervalo em data_pedido e, por produto, pedido.id IN (subconsulta em
+    # item_pedido pelo índice de produto). Um EXISTS correlacionado levaria o
+    # SQLite a percorrer pedido inteiro, consultando item_pedido por pedido_id
+    if filtro is None:
+        return query
+    if filtro.cliente is not None:
+        query = query.where(Pedido.cliente == filtro.cliente)
+    if filtro.data_inicio is not None:
+        query = query.where(Pedido.data_pedido >= filtro.data_inicio)
+    if filtro.data_fim is not None:
+        query = query.where(Pedido.data_pedido <= filtro.data_fim)
+    if filtro.produto is not None:
+        query = query.where(Pedido.id.in_(select(ItemPedido.pedido_id).where(ItemPedido.produto == filtro.produto)))
+    return query
+
+class PedidoRepository:
+    def __init__(self, db: Session, loading: str = "selectin"):
+        self.db = db
+        # Estratégia usada para carregar os itens nas listagens (evita N+1)
+        self.itens_option = loader_option(Pedido.itens, loading)
+
+    def create(self, pedido: Pedido) -> Pedido:
+        try:
+            self.db.add(pedido)
+            self.db.commit()
+            return pedido
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao criar pedido: {str(e)}")
+
+    def create_many(self, pedidos: List[dict]) -> List[int]:
+        # Lote em uma única transação: INSERT multi-linha para pedido (com
+        # RETURNING quando o banco suporta) e executemany para item_pedido
+        try:
+            dialect = self.db.get_bind().dialect
+            linhas = [{"cliente": p["cliente"], "data_pedido": p["data_pedido"]} for p in pedidos]
+            if dialect.insert_executemany_returning_sort_by_parameter_order:
+                ids = self.db.scalars(insert(Pedido).returning(Pedido.id, sort_by_parameter_order=True),
+                                      linhas).all()
+            else:
+                # Sem RETURNING (MySQL), o id de cada pedido vem do lastrowid
+                ids = [self.db.execute(insert(Pedido).values(**linha)).inserted_primary_key[0]
+                       for linha in linhas]
+            itens = [dict(item, pedido_id=pedido_id)
+                     for pedido_id, pedido in zip(ids, pedidos) for item in pedido["itens"]]
+            if itens:
+                self.db.execute(insert(ItemPedido), itens)
+            self.db.commit()
+            return list(ids)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao criar pedidos: {str(e)}")
+
+    def read_by_id(self, pedido_id: int) -> Pedido:
+        try:
+            return self.db.get(Pedido, pedido_id)
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler pedido: {str(e)}")
+
+    def read_all(self) -> List[Pedido]:
+        try:
+            return self.db.query(Pedido).options(self.itens_option).all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    def read_page(self, limit: int, after: Optional[int] = None,
+                  filtro: Optional[PedidoFiltroSchema] = None) -> List[Pedido]:
+        # Paginação por chave (keyset): usa o índice da chave primária,
+        # então o custo de uma página não depende da sua posição na tabela
+        try:
+            query = filtrar_pedidos(self.db.query(Pedido).options(self.itens_option), filtro)
+            if after is not None:
+                query = query.filter(Pedido.id > after)
+            return query.order_by(Pedido.id).limit(limit).all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    def stream_rows(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> Iterator:
+        try:
+            yield from self.db.execute(export_query(data_inicio, data_fim))
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao exportar pedidos: {str(e)}")
+
+    def read_version(self, pedido_id: int) -> Optional[int]:
+        # Consulta só a versão, sem carregar o pedido (usada na validação do ETag)
+        try:
+            return self.db.query(Pedido.versao).filter(Pedido.id == pedido_id).scalar()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao ler pedido: {str(e)}")
+
+    def read_page_versions(self, limit: int, after: Optional[int] = None,
+                           filtro: Optional[PedidoFiltroSchema] = None) -> List[Tuple[int, int]]:
+        try:
+            query = filtrar_pedidos(self.db.query(Pedido.id, Pedido.versao), filtro)
+            if after is not None:
+                query = query.filter(Pedido.id > after)
+            return [tuple(linha) for linha in query.order_by(Pedido.id).limit(limit).all()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    def update(self, pedido: Pedido) -> Pedido:
+        try:
+            self.db.commit()
+            return pedido
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
+
+    def delete(self, pedido_id: int) -> None:
+        # Um único DELETE, sem carregar o pedido: os itens saem pelo ON DELETE
+        # CASCADE e o "não encontrado" vem do número de linhas afetadas
+        try:
+            resultado = self.db.execute(delete(Pedido).where(Pedido.id == pedido_id))
+            self.db.commit()
+            if resultado.rowcount == 0:
+                raise ValueError("Pedido não encontrado")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Erro ao deletar pedido: {str(e)}")
@@ -0,0 +1,78 @@
+from sqlalchemy import select, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from datetime import date
+from typing import List, Optional
+
+# Agregações calculadas no banco (SUM/COUNT com GROUP BY): cada relatório é
+# uma única consulta e só as linhas de resumo trafegam até a aplicação
+VALOR_ITEM = ItemPedido.quantidade * ItemPedido.preco
+
+def _periodo(query, data_inicio: Optional[date], data_fim: Optional[date]):
+    if data_inicio is not None:
+        query = query.where(Pedido.data_pedido >= data_inicio)
+    if data_fim is not None:
+        query = query.where(Pedido.data_pedido <= data_fim)
+    return query
+
+def total_pedido_query(pedido_id: int):
+    return (select(Pedido.id.label("pedido_id"),
+                   func.coalesce(func.sum(VALOR_ITEM), 0).label("total"),
+                   func.count(ItemPedido.id).label("itens"))
+            .outerjoin(ItemPedido, ItemPedido.pedido_id == Pedido.id)
+            .where(Pedido.id == pedido_id)
+            .group_by(Pedido.id))
+
+def receita_por_dia_query(data_inicio: Optional[date], data_fim: Optional[date]):
+    query = (select(Pedido.data_pedido.label("dia"),
+                    func.count(func.distinct(Pedido.id)).label("pedidos"),
+                    func.sum(VALOR_ITEM).label("receita"))
+             .join(ItemPedido, ItemPedido.pedido_id == Pedido.id))
+    return _periodo(query, data_inicio, data_fim).group_by(Pedido.data_pedido).order_by(Pedido.data_pedido)
+
+def receita_por_cliente_query(data_inicio: Optional[date], data_fim: Optional[date], limit: int):
+    receita = func.sum(VALOR_ITEM).label("receita")
+    query = (select(Pedido.cliente, func.count(func.distinct(Pedido.id)).label("pedidos"), receita)
+             .join(ItemPedido, ItemPedido.pedido_id == Pedido.id))
+    return _periodo(query, data_inicio, data_fim).group_by(Pedido.cliente).order_by(receita.desc()).limit(limit)
+
+def top_produtos_query(data_inicio: Optional[date], data_fim: Optional[date], limit: int):
+    receita = func.sum(VALOR_ITEM).label("receita")
+    query = (select(ItemPedido.produto, func.sum(ItemPedido.quantidade).label("quantidade"), receita)
+             .join(Pedido, Pedido.id == ItemPedido.pedido_id))
+    return _periodo(query, data_inicio, data_fim).group_by(ItemPedido.produto).order_by(receita.desc()).limit(limit)
+
+class RelatorioRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def order_total(self, pedido_id: int) -> Optional[dict]:
+        try:
+            linha = self.db.execute(total_pedido_query(pedido_id)).mappings().first()
+            return dict(linha) if linha else None
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular total do pedido: {str(e)}")
+
+    def revenue_by_day(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> List[dict]:
+        try:
+            return [dict(linha) for linha in self.db.execute(receita_por_dia_query(data_inicio, data_fim)).mappings()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular receita por dia: {str(e)}")
+
+    def revenue_by_client(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                          limit: int = 50) -> List[dict]:
+        try:
+            query = receita_por_cliente_query(data_inicio, data_fim, limit)
+            return [dict(linha) for linha in self.db.execute(query).mappings()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular receita por cliente: {str(e)}")
+
+    def top_products(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                     limit: int = 10) -> List[dict]:
+        try:
+            query = top_produtos_query(data_inicio, data_fim, limit)
+            return [dict(linha) for linha in self.db.execute(query).mappings()]
+        except SQLAlchemyError as e:
+            raise ValueError(f"Erro ao calcular produtos mais vendidos: {str(e)}")
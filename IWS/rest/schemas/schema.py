@@ -0,0 +1,102 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+# Itens do pedido
+class ItemPedidoCreateSchema(BaseModel):
+    produto: str
+    quantidade: int
+    preco: Decimal
+
+class ItemPedidoOutSchema(ItemPedidoCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+# Pedidos
+class PedidoCreateSchema(BaseModel):
+    cliente: str
+    data_pedido: Optional[date] = None
+    itens: List[ItemPedidoCreateSchema]
+
+# Limite de pedidos por requisição em POST /pedidos/batch
+MAX_BATCH_SIZE = 5000
+
+class PedidoBatchSchema(BaseModel):
+    pedidos: List[PedidoCreateSchema] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+class ResultadoLoteSchema(BaseModel):
+    indice: int
+    id: Optional[int] = None
+    erro: Optional[str] = None
+
+class PedidoBatchOutSchema(BaseModel):
+    criados: int
+    rejeitados: int
+    resultados: List[ResultadoLoteSchema]
+
+class PedidoUpdateSchema(BaseModel):
+    cliente: Optional[str] = None
+    data_pedido: Optional[date] = None
+
+class PedidoFiltroSchema(BaseModel):
+    # Filtros de GET /pedidos, aplicados na consulta (ver filtrar_pedidos)
+    cliente: Optional[str] = Field(None, max_length=100)
+    data_inicio: Optional[date] = None
+    data_fim: Optional[date] = None
+    produto: Optional[str] = Field(None, max_length=100)
+
+class PedidoOutSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    cliente: str
+    data_pedido: date
+    versao: int
+    itens: List[ItemPedidoOutSchema] = []
+
+# Clientes
+class ClienteCreateSchema(BaseModel):
+    nome: str
+    idade: Optional[int] = None
+
+class ClienteUpdateSchema(BaseModel):
+    nome: Optional[str] = None
+    idade: Optional[int] = None
+
+class ClienteOutSchema(ClienteCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    versao: int
+
+# Relatórios (agregados calculados no banco)
+class TotalPedidoSchema(BaseModel):
+    pedido_id: int
+    total: Decimal
+    itens: int
+
+class ReceitaDiaSchema(BaseModel):
+    dia: date
+    pedidos: int
+    receita: Decimal
+
+class ReceitaClienteSchema(BaseModel):
+    cliente: str
+    pedidos: int
+    receita: Decimal
+
+class ProdutoVendidoSchema(BaseModel):
+    produto: str
+    quantidade: int
+    receita: Decimal
+
+# Páginas (paginação por cursor)
+class PaginaPedidoSchema(BaseModel):
+    itens: List[PedidoOutSchema]
+    next: Optional[str] = None
+
+class PaginaClienteSchema(BaseModel):
+    itens: List[ClienteOutSchema]
+    next: Optional[str] = None
@@ -0,0 +1,45 @@
+import argparse
+import asyncio
+import importlib.util
+import platform
+import uvicorn
+from config.settings import get_server_settings
+
+# Modo de produção: vários processos (workers) atrás do mesmo socket, para usar
+# todos os núcleos da máquina. Cada worker importa "app:app" e monta o próprio
+# engine na subida (lifespan), sem herdar conexões do processo principal.
+#   WEB_CONCURRENCY=8 python server.py
+#   python server.py --workers 8 --port 8080
+
+def disponivel(modulo: str) -> bool:
+    return importlib.util.find_spec(modulo) is not None
+
+def uvicorn_options(settings, workers: int, host: str, port: int) -> dict:
+    return {
+        "host": host,
+        "port": port,
+        "workers": workers,
+        # uvloop e httptools (uvicorn[standard]) quando instalados; senão o
+        # loop padrão do asyncio e o parser h11, em Python puro
+        "loop": "uvloop" if disponivel("uvloop") else "asyncio",
+        "http": "httptools" if disponivel("httptools") else "h11",
+        "backlog": settings.backlog,
+        "timeout_keep_alive": settings.keep_alive,
+        # No SIGTERM para de aceitar conexões e espera as requisições em curso
+        # até esse prazo antes de encerrar o worker
+        "timeout_graceful_shutdown": settings.graceful_timeout,
+        # A latência por rota já é registrada pelo middleware de métricas
+        "access_log": False,
+    }
+
+if __name__ == "__main__":
+    settings = get_server_settings()
+    parser = argparse.ArgumentParser(description="Servidor de produção da API de pedidos")
+    parser.add_argument("--workers", type=int, default=settings.workers)
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    args = parser.parse_args()
+    # Configurar SelectorEventLoop no Windows para evitar erros de conexão
+    if platform.system() == "Windows":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    uvicorn.run("app:app", **uvicorn_options(settings, args.workers, args.host, args.port))
@@ -0,0 +1,48 @@
+from typing import List, Optional, Tuple
+from models.cliente import Cliente
+from repositories.async_cliente_repository import AsyncClienteRepository
+from services.cliente_service import ClienteService
+from schemas.schema import ClienteCreateSchema, ClienteUpdateSchema
+
+class AsyncClienteService:
+    def __init__(self, repository: AsyncClienteRepository):
+        self.repository = repository
+
+    async def create_cliente(self, cliente_data: ClienteCreateSchema) -> Cliente:
+        return await self.repository.create(ClienteService.build_cliente(cliente_data))
+
+    async def read_cliente_by_id(self, cliente_id: int) -> Cliente:
+        cliente = await self.repository.read_by_id(cliente_id)
+        if not cliente:
+            raise ValueError("Cliente não encontrado")
+        return cliente
+
+    async def read_all_clientes(self) -> List[Cliente]:
+        return await self.repository.read_all()
+
+    async def read_clientes_page(self, limit: int, after: Optional[int] = None) -> Tuple[List[Cliente], Optional[int]]:
+        clientes = await self.repository.read_page(limit + 1, after)
+        if len(clientes) > limit:
+            clientes = clientes[:limit]
+            return clientes, clientes[-1].id
+        return clientes, None
+
+    async def read_cliente_version(self, cliente_id: int) -> int:
+        versao = await self.repository.read_version(cliente_id)
+        if versao is None:
+            raise ValueError("Cliente não encontrado")
+        return versao
+
+    async def read_clientes_page_versions(self, limit: int, after: Optional[int] = None) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+        pares = await self.repository.read_page_versions(limit + 1, after)
+        if len(pares) > limit:
+            pares = pares[:limit]
+            return pares, pares[-1][0]
+        return pares, None
+
+    async def update_cliente(self, cliente_id: int, update_data: ClienteUpdateSchema) -> Cliente:
+        cliente = await self.read_cliente_by_id(cliente_id)
+        return await self.repository.update(ClienteService.apply_update(cliente, update_data))
+
+    async def delete_cliente(self, cliente_id: int) -> None:
+        await self.repository.delete(cliente_id)
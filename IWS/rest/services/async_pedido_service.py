@@ -0,0 +1,70 @@
+from typing import AsyncIterator, List, Optional, Tuple
+from datetime import date
+from models.pedido import Pedido
+from repositories.async_pedido_repository import AsyncPedidoRepository
+from services.pedido_service import PedidoService
+from schemas.schema import PedidoCreateSchema, PedidoUpdateSchema, PedidoFiltroSchema
+
+class AsyncPedidoService:
+    def __init__(self, repository: AsyncPedidoRepository):
+        self.repository = repository
+
+    async def create_pedido(self, pedido_data: PedidoCreateSchema) -> Pedido:
+        return await self.repository.create(PedidoService.build_pedido(pedido_data))
+
+    async def create_pedidos_batch(self, pedidos_data: List[PedidoCreateSchema]) -> List[dict]:
+        resultados, linhas, pendentes = PedidoService.prepare_batch(pedidos_data)
+        if linhas:
+            for resultado, pedido_id in zip(pendentes, await self.repository.create_many(linhas)):
+                resultado["id"] = pedido_id
+        return resultados
+
+    async def read_pedido_by_id(self, pedido_id: int) -> Pedido:
+        pedido = await self.repository.read_by_id(pedido_id)
+        if not pedido:
+            raise ValueError("Pedido não encontrado")
+        return pedido
+
+    async def read_all_pedidos(self) -> List[Pedido]:
+        return await self.repository.read_all()
+
+    async def read_pedidos_page(self, limit: int, after: Optional[int] = None,
+                                filtro: Optional[PedidoFiltroSchema] = None) -> Tuple[List[Pedido], Optional[int]]:
+        pedidos = await self.repository.read_page(limit + 1, after, filtro)
+        if len(pedidos) > limit:
+            pedidos = pedidos[:limit]
+            return pedidos, pedidos[-1].id
+        return pedidos, None
+
+    async def stream_pedidos(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> AsyncIterator[dict]:
+        atual = None
+        async for linha in self.repository.stream_rows(data_inicio, data_fim):
+            if atual is None or atual["id"] != linha.pedido_id:
+                if atual is not None:
+                    yield atual
+                atual = PedidoService.novo_pedido_exportado(linha)
+            if linha.item_id is not None:
+                atual["itens"].append(PedidoService.item_exportado(linha))
+        if atual is not None:
+            yield atual
+
+    async def read_pedido_version(self, pedido_id: int) -> int:
+        versao = await self.repository.read_version(pedido_id)
+        if versao is None:
+            raise ValueError("Pedido não encontrado")
+        return versao
+
+    async def read_pedidos_page_versions(self, limit: int, after: Optional[int] = None,
+                                         filtro: Optional[PedidoFiltroSchema] = None) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+        pares = await self.repository.read_page_versions(limit + 1, after, filtro)
+        if len(pares) > limit:
+            pares = pares[:limit]
+            return pares, pares[-1][0]
+        return pares, None
+
+    async def update_pedido(self, pedido_id: int, update_data: PedidoUpdateSchema) -> Pedido:
+        pedido = await self.read_pedido_by_id(pedido_id)
+        return await self.repository.update(PedidoService.apply_update(pedido, update_data))
+
+    async def delete_pedido(self, pedido_id: int) -> None:
+        await self.repository.delete(pedido_id)
@@ -0,0 +1,28 @@
+from datetime import date
+from typing import List, Optional
+from repositories.async_relatorio_repository import AsyncRelatorioRepository
+from services.relatorio_service import RelatorioService
+
+class AsyncRelatorioService:
+    def __init__(self, repository: AsyncRelatorioRepository):
+        self.repository = repository
+
+    async def read_pedido_total(self, pedido_id: int) -> dict:
+        total = await self.repository.order_total(pedido_id)
+        if not total:
+            raise ValueError("Pedido não encontrado")
+        return total
+
+    async def read_revenue_by_day(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> List[dict]:
+        RelatorioService.validate_periodo(data_inicio, data_fim)
+        return await self.repository.revenue_by_day(data_inicio, data_fim)
+
+    async def read_revenue_by_client(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                                     limit: int = 50) -> List[dict]:
+        RelatorioService.validate_periodo(data_inicio, data_fim)
+        return await self.repository.revenue_by_client(data_inicio, data_fim, limit)
+
+    async def read_top_products(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                                limit: int = 10) -> List[dict]:
+        RelatorioService.validate_periodo(data_inicio, data_fim)
+        return await self.repository.top_products(data_inicio, data_fim, limit)
@@ -0,0 +1,61 @@
+from typing import List, Optional, Tuple
+from models.cliente import Cliente
+from repositories.cliente_repository import ClienteRepository
+from schemas.schema import ClienteCreateSchema, ClienteUpdateSchema
+
+class ClienteService:
+    def __init__(self, repository: ClienteRepository):
+        self.repository = repository
+
+    @staticmethod
+    def build_cliente(cliente_data: ClienteCreateSchema) -> Cliente:
+        if not cliente_data.nome:
+            raise ValueError("Nome é obrigatório")
+        return Cliente(**cliente_data.model_dump())
+
+    @staticmethod
+    def apply_update(cliente: Cliente, update_data: ClienteUpdateSchema) -> Cliente:
+        if update_data.nome:
+            cliente.nome = update_data.nome
+        if update_data.idade is not None:
+            cliente.idade = update_data.idade
+        return cliente
+
+    def create_cliente(self, cliente_data: ClienteCreateSchema) -> Cliente:
+        return self.repository.create(self.build_cliente(cliente_data))
+
+    def read_cliente_by_id(self, cliente_id: int) -> Cliente:
+        cliente = self.repository.read_by_id(cliente_id)
+        if not cliente:
+            raise ValueError("Cliente não encontrado")
+        return cliente
+
+    def read_all_clientes(self) -> List[Cliente]:
+        return self.repository.read_all()
+
+    def read_clientes_page(self, limit: int, after: Optional[int] = None) -> Tuple[List[Cliente], Optional[int]]:
+        clientes = self.repository.read_page(limit + 1, after)
+        if len(clientes) > limit:
+            clientes = clientes[:limit]
+            return clientes, clientes[-1].id
+        return clientes, None
+
+    def read_cliente_version(self, cliente_id: int) -> int:
+        versao = self.repository.read_version(cliente_id)
+        if versao is None:
+            raise ValueError("Cliente não encontrado")
+        return versao
+
+    def read_clientes_page_versions(self, limit: int, after: Optional[int] = None) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+        pares = self.repository.read_page_versions(limit + 1, after)
+        if len(pares) > limit:
+            pares = pares[:limit]
+            return pares, pares[-1][0]
+        return pares, None
+
+    def update_cliente(self, cliente_id: int, update_data: ClienteUpdateSchema) -> Cliente:
+        cliente = self.read_cliente_by_id(cliente_id)
+        return self.repository.update(self.apply_update(cliente, update_data))
+
+    def delete_cliente(self, cliente_id: int) -> None:
+        self.repository.delete(cliente_id)
@@ -0,0 +1,134 @@
+from typing import Iterator, List, Optional, Tuple
+from datetime import date
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from repositories.pedido_repository import PedidoRepository
+from schemas.schema import PedidoCreateSchema, PedidoUpdateSchema, PedidoFiltroSchema
+
+class PedidoService:
+    def __init__(self, repository: PedidoRepository):
+        self.repository = repository
+
+    @staticmethod
+    def validate_pedido(pedido_data: PedidoCreateSchema) -> None:
+        if not pedido_data.cliente:
+            raise ValueError("Cliente é obrigatório")
+        if not pedido_data.itens:
+            raise ValueError("Pelo menos um item é obrigatório")
+
+    @staticmethod
+    def validate_filtro(filtro: Optional[PedidoFiltroSchema]) -> None:
+        if filtro and filtro.data_inicio and filtro.data_fim and filtro.data_inicio > filtro.data_fim:
+            raise ValueError("data_inicio deve ser anterior a data_fim")
+
+    @staticmethod
+    def build_pedido(pedido_data: PedidoCreateSchema) -> Pedido:
+        # Validação e montagem compartilhadas com o AsyncPedidoService
+        PedidoService.validate_pedido(pedido_data)
+        pedido = Pedido(cliente=pedido_data.cliente)
+        if pedido_data.data_pedido:
+            pedido.data_pedido = pedido_data.data_pedido
+        pedido.itens = [ItemPedido(**item.model_dump()) for item in pedido_data.itens]
+        return pedido
+
+    @staticmethod
+    def apply_update(pedido: Pedido, update_data: PedidoUpdateSchema) -> Pedido:
+        if update_data.cliente:
+            pedido.cliente = update_data.cliente
+        if update_data.data_pedido:
+            pedido.data_pedido = update_data.data_pedido
+        return pedido
+
+    @staticmethod
+    def prepare_batch(pedidos_data: List[PedidoCreateSchema]) -> Tuple[List[dict], List[dict], List[dict]]:
+        # Valida cada pedido do lote separadamente: os inválidos viram resultados
+        # com erro e os válidos viram linhas para o INSERT em lote. "pendentes"
+        # guarda os resultados dos válidos, na mesma ordem das linhas, para
+        # receberem o id gerado
+        resultados, linhas, pendentes = [], [], []
+        for indice, pedido_data in enumerate(pedidos_data):
+            resultado = {"indice": indice, "id": None, "erro": None}
+            resultados.append(resultado)
+            try:
+                PedidoService.validate_pedido(pedido_data)
+            except ValueError as e:
+                resultado["erro"] = str(e)
+                continue
+            linhas.append({
+                "cliente": pedido_data.cliente,
+                "data_pedido": pedido_data.data_pedido or date.today(),
+                "itens": [item.model_dump() for item in pedido_data.itens],
+            })
+            pendentes.append(resultado)
+        return resultados, linhas, pendentes
+
+    @staticmethod
+    def novo_pedido_exportado(linha) -> dict:
+        return {"id": linha.pedido_id, "cliente": linha.cliente, "data_pedido": linha.data_pedido, "itens": []}
+
+    @staticmethod
+    def item_exportado(linha) -> dict:
+        return {"id": linha.item_id, "produto": linha.produto, "quantidade": linha.quantidade, "preco": linha.preco}
+
+    def create_pedido(self, pedido_data: PedidoCreateSchema) -> Pedido:
+        return self.repository.create(self.build_pedido(pedido_data))
+
+    def create_pedidos_batch(self, pedidos_data: List[PedidoCreateSchema]) -> List[dict]:
+        resultados, linhas, pendentes = self.prepare_batch(pedidos_data)
+        if linhas:
+            for resultado, pedido_id in zip(pendentes, self.repository.create_many(linhas)):
+                resultado["id"] = pedido_id
+        return resultados
+
+    def read_pedido_by_id(self, pedido_id: int) -> Pedido:
+        pedido = self.repository.read_by_id(pedido_id)
+        if not pedido:
+            raise ValueError("Pedido não encontrado")
+        return pedido
+
+    def read_all_pedidos(self) -> List[Pedido]:
+        return self.repository.read_all()
+
+    def read_pedidos_page(self, limit: int, after: Optional[int] = None,
+                          filtro: Optional[PedidoFiltroSchema] = None) -> Tuple[List[Pedido], Optional[int]]:
+        # Busca um registro a mais só para saber se existe próxima página
+        pedidos = self.repository.read_page(limit + 1, after, filtro)
+        if len(pedidos) > limit:
+            pedidos = pedidos[:limit]
+            return pedidos, pedidos[-1].id
+        return pedidos, None
+
+    def stream_pedidos(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> Iterator[dict]:
+        # As linhas vêm ordenadas por pedido: basta juntar as consecutivas,
+        # mantendo em memória apenas o pedido atual
+        atual = None
+        for linha in self.repository.stream_rows(data_inicio, data_fim):
+            if atual is None or atual["id"] != linha.pedido_id:
+                if atual is not None:
+                    yield atual
+                atual = self.novo_pedido_exportado(linha)
+            if linha.item_id is not None:
+                atual["itens"].append(self.item_exportado(linha))
+        if atual is not None:
+            yield atual
+
+    def read_pedido_version(self, pedido_id: int) -> int:
+        versao = self.repository.read_version(pedido_id)
+        if versao is None:
+            raise ValueError("Pedido não encontrado")
+        return versao
+
+    def read_pedidos_page_versions(self, limit: int, after: Optional[int] = None,
+                                   filtro: Optional[PedidoFiltroSchema] = None) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+        pares = self.repository.read_page_versions(limit + 1, after, filtro)
+        if len(pares) > limit:
+            pares = pares[:limit]
+            return pares, pares[-1][0]
+        return pares, None
+
+    def update_pedido(self, pedido_id: int, update_data: PedidoUpdateSchema) -> Pedido:
+        pedido = self.read_pedido_by_id(pedido_id)
+        return self.repository.update(self.apply_update(pedido, update_data))
+
+    def delete_pedido(self, pedido_id: int) -> None:
+        self.repository.delete(pedido_id)
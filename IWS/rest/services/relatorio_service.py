@@ -0,0 +1,32 @@
+from datetime import date
+from typing import List, Optional
+from repositories.relatorio_repository import RelatorioRepository
+
+class RelatorioService:
+    def __init__(self, repository: RelatorioRepository):
+        self.repository = repository
+
+    @staticmethod
+    def validate_periodo(data_inicio: Optional[date], data_fim: Optional[date]) -> None:
+        if data_inicio and data_fim and data_inicio > data_fim:
+            raise ValueError("data_inicio deve ser anterior a data_fim")
+
+    def read_pedido_total(self, pedido_id: int) -> dict:
+        total = self.repository.order_total(pedido_id)
+        if not total:
+            raise ValueError("Pedido não encontrado")
+        return total
+
+    def read_revenue_by_day(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> List[dict]:
+        self.validate_periodo(data_inicio, data_fim)
+        return self.repository.revenue_by_day(data_inicio, data_fim)
+
+    def read_revenue_by_client(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                               limit: int = 50) -> List[dict]:
+        self.validate_periodo(data_inicio, data_fim)
+        return self.repository.revenue_by_client(data_inicio, data_fim, limit)
+
+    def read_top_products(self, data_inicio: Optional[date] = None, data_fim: Optional[date] = None,
+                          limit: int = 10) -> List[dict]:
+        self.validate_periodo(data_inicio, data_fim)
+        return self.repository.top_products(data_inicio, data_fim, limit)
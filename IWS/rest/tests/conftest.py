@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+
+# Os módulos da aplicação são importados a partir da raiz (models, repositories...)
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from config.database import sqlite_foreign_keys
+from models.base import Base
+# Registra os modelos no metadata antes do create_all
+from models.cliente import Cliente
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+
+@pytest.fixture
+def engine(tmp_path):
+    # Banco SQLite temporário, com o esquema criado a partir dos models
+    engine = sqlite_foreign_keys(create_engine(f"sqlite:///{tmp_path / 'pedidos.db'}"))
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
@@ -0,0 +1,39 @@
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from models.pedido import Pedido
+from repositories.pedido_repository import filtrar_pedidos
+from schemas.schema import PedidoFiltroSchema
+
+def plano(engine, filtro: PedidoFiltroSchema) -> str:
+    # Executa a consulta montada por filtrar_pedidos, captura o SQL enviado ao
+    # banco e roda EXPLAIN QUERY PLAN sobre ele, com os mesmos parâmetros
+    consultas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        consultas.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        with Session(engine) as db:
+            db.execute(filtrar_pedidos(select(Pedido), filtro)).all()
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+    statement, parameters = consultas[0]
+    with engine.connect() as conn:
+        linhas = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return "\n".join(linha[-1] for linha in linhas)
+
+@pytest.mark.parametrize("filtro, indice", [
+    (PedidoFiltroSchema(cliente="Ana"), "ix_pedido_cliente"),
+    (PedidoFiltroSchema(data_inicio=date(2025, 1, 1), data_fim=date(2025, 1, 31)), "ix_pedido_data_pedido"),
+    (PedidoFiltroSchema(produto="Livro"), "ix_item_pedido_produto"),
+])
+def test_filtros_usam_indices(engine, filtro, indice):
+    detalhes = plano(engine, filtro)
+    assert re.search(rf"USING (COVERING )?INDEX {indice}\b", detalhes), detalhes
+    assert "SCAN pedido" not in detalhes, detalhes
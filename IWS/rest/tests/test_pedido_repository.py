@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from repositories.pedido_repository import PedidoRepository
+
+def criar_pedidos(engine, quantidade: int):
+    with Session(engine) as db:
+        for n in range(quantidade):
+            pedido = Pedido(cliente=f"Cliente {n}", data_pedido=date(2025, 1, 1))
+            pedido.itens = [ItemPedido(produto=f"Produto {i}", quantidade=1, preco=10) for i in range(3)]
+            db.add(pedido)
+        db.commit()
+
+@contextmanager
+def contar_consultas(engine):
+    consultas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        consultas.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        yield consultas
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+def consultas_da_listagem(engine, loading: str) -> int:
+    # Lista todos os pedidos e acessa os itens de cada um, como faz a
+    # serialização de GET /pedidos
+    with Session(engine) as db, contar_consultas(engine) as consultas:
+        pedidos = PedidoRepository(db, loading).read_all()
+        assert all(len(pedido.itens) == 3 for pedido in pedidos)
+    return len(consultas)
+
+@pytest.mark.parametrize("loading", ["selectin", "joined"])
+def test_listagem_usa_numero_constante_de_consultas(engine, loading):
+    criar_pedidos(engine, 1)
+    com_um = consultas_da_listagem(engine, loading)
+    criar_pedidos(engine, 49)
+    com_cinquenta = consultas_da_listagem(engine, loading)
+    assert com_um == com_cinquenta
+
+def test_listagem_lazy_faz_uma_consulta_por_pedido(engine):
+    # Referência: sem carregamento antecipado, cada pedido custa um SELECT a mais
+    criar_pedidos(engine, 1)
+    com_um = consultas_da_listagem(engine, "lazy")
+    criar_pedidos(engine, 49)
+    assert consultas_da_listagem(engine, "lazy") == com_um + 49
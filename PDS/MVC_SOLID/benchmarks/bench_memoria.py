@@ -0,0 +1,115 @@
+# Benchmark de memória do PedidoRepository.
+#
+# Executa milhares de operações (leituras por id, listagens filtradas,
+# criações e atualizações) contra um banco SQLite local e registra o RSS do
+# processo a intervalos. Com uma sessão por operação o RSS fica estável; com
+# --sessao-unica o repositório reproduz o comportamento anterior (uma sessão
+# aberta até o fim) e o identity map cresce com cada pedido lido.
+#
+#   python benchmarks/bench_memoria.py --operacoes 20000
+#   python benchmarks/bench_memoria.py --operacoes 20000 --sessao-unica
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+def rss_mb() -> float:
+    # RSS atual (Linux); em outros sistemas usa o pico (ru_maxrss), que só cresce
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / 2**20 if sys.platform == "darwin" else pico / 1024
+
+def popular_banco(pedidos: int, seed: int):
+    from sqlalchemy import insert
+    from config.database import get_engine
+    from models.base import Base
+    from models.pedido import Pedido
+    from models.item_pedido import ItemPedido
+
+    engine = get_engine()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    aleatorio = random.Random(seed)
+    inicio = date.today() - timedelta(days=365)
+    with engine.begin() as conn:
+        conn.execute(insert(Pedido), [
+            {"id": pedido_id, "cliente": f"Cliente {aleatorio.randrange(500)}",
+             "data_pedido": inicio + timedelta(days=aleatorio.randrange(365))}
+            for pedido_id in range(1, pedidos + 1)])
+        conn.execute(insert(ItemPedido), [
+            {"pedido_id": pedido_id, "produto": f"Produto {aleatorio.randrange(100)}",
+             "quantidade": aleatorio.randint(1, 5), "preco": round(aleatorio.uniform(5, 500), 2)}
+            for pedido_id in range(1, pedidos + 1) for _ in range(3)])
+
+def criar_repositorio(sessao_unica: bool):
+    from config.database import SessionLocal
+    from repositories.pedido_repository import PedidoRepository
+
+    class PedidoRepositorySessaoUnica(PedidoRepository):
+        # Comportamento anterior, para comparação: uma sessão para tudo
+        def __init__(self):
+            super().__init__()
+            self.db = SessionLocal()
+
+        @contextmanager
+        def _sessao(self):
+            yield self.db
+
+    return PedidoRepositorySessaoUnica() if sessao_unica else PedidoRepository()
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS do PedidoRepository ao longo de muitas operações")
+    parser.add_argument("--pedidos", type=int, default=20000, help="pedidos no banco antes da medição")
+    parser.add_argument("--operacoes", type=int, default=20000)
+    parser.add_argument("--amostras", type=int, default=10)
+    parser.add_argument("--sessao-unica", action="store_true", help="reproduz a sessão de vida longa anterior")
+    parser.add_argument("--db", type=Path, default=RAIZ / "benchmarks" / "bench_memoria.db")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Precisa acontecer antes da primeira chamada de get_settings()
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+    popular_banco(args.pedidos, args.seed)
+
+    from services.pedido_service import PedidoService
+
+    repository = criar_repositorio(args.sessao_unica)
+    service = PedidoService(repository)
+    aleatorio = random.Random(args.seed)
+    intervalo = max(args.operacoes // args.amostras, 1)
+    gc.collect()
+    inicial = rss_mb()
+    print(f"Modo: {'sessão única' if args.sessao_unica else 'sessão por operação'}; RSS inicial {inicial:.1f} MB")
+    inicio = time.perf_counter()
+    for n in range(1, args.operacoes + 1):
+        operacao = n % 10
+        if operacao < 6:
+            service.read_pedido_by_id(aleatorio.randint(1, args.pedidos))
+        elif operacao < 8:
+            service.read_pedidos_filtrados(cliente=f"Cliente {aleatorio.randrange(500)}")
+        elif operacao == 8:
+            service.create_pedido("Cliente bench", [{"produto": "Produto bench", "quantidade": 1, "preco": 10}])
+        else:
+            service.patch_pedido(aleatorio.randint(1, args.pedidos), novo_cliente=f"Cliente {aleatorio.randrange(500)}")
+        if n % intervalo == 0:
+            gc.collect()
+            atual = rss_mb()
+            print(f"{n:>8} operações  RSS {atual:8.1f} MB  ({atual - inicial:+.1f} MB)")
+    duracao = time.perf_counter() - inicio
+    print(f"{args.operacoes / duracao:.0f} operações/s")
+    repository.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# Vazão do PedidoService com o repositório em memória e com o SQLite.
+#
+# A mesma carga (criações, leituras por id, listagens filtradas, atualizações
+# parciais e exclusões) roda sobre InMemoryPedidoRepository e sobre o
+# PedidoRepository com um arquivo SQLite. O repositório em memória mostra o
+# custo do próprio serviço; a diferença para o SQLite é o custo do banco.
+#
+#   python benchmarks/bench_repositorios.py --pedidos 5000
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+def preparar_sqlite(db_path: Path):
+    # Precisa acontecer antes da primeira chamada de get_settings()
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    from config.database import get_engine
+    from models.base import Base
+    from models.pedido import Pedido
+    from models.item_pedido import ItemPedido
+
+    Base.metadata.drop_all(bind=get_engine())
+    Base.metadata.create_all(bind=get_engine())
+
+def itens(aleatorio: random.Random) -> list:
+    return [{"produto": f"Produto {aleatorio.randrange(100)}", "quantidade": aleatorio.randint(1, 5),
+             "preco": round(aleatorio.uniform(5, 500), 2)} for _ in range(3)]
+
+def medir(operacao, vezes: int) -> float:
+    inicio = time.perf_counter()
+    for n in range(vezes):
+        operacao(n)
+    return vezes / (time.perf_counter() - inicio)
+
+def executar(service, pedidos: int, seed: int) -> dict:
+    aleatorio = random.Random(seed)
+    inicio = date.today() - timedelta(days=365)
+    ids = []
+
+    def criar(n):
+        pedido = service.create_pedido(f"Cliente {aleatorio.randrange(500)}", itens(aleatorio))
+        ids.append(pedido.id)
+
+    def atualizar_data(n):
+        # Espalha os pedidos pelo último ano (create_pedido usa a data de hoje)
+        service.patch_pedido(ids[n], nova_data=inicio + timedelta(days=aleatorio.randrange(365)))
+
+    def ler(n):
+        service.read_pedido_by_id(aleatorio.choice(ids))
+
+    def filtrar_cliente(n):
+        service.read_pedidos_filtrados(cliente=f"Cliente {aleatorio.randrange(500)}")
+
+    def filtrar_periodo(n):
+        dia = inicio + timedelta(days=aleatorio.randrange(358))
+        service.read_pedidos_filtrados(data_inicio=dia, data_fim=dia + timedelta(days=7))
+
+    def deletar(n):
+        service.delete_pedido(ids[n])
+
+    consultas = max(pedidos // 10, 1)
+    resultados = {
+        "create_pedido": medir(criar, pedidos),
+        "patch_pedido": medir(atualizar_data, pedidos),
+        "read_pedido_by_id": medir(ler, pedidos),
+        "read_pedidos_filtrados (cliente)": medir(filtrar_cliente, consultas),
+        "read_pedidos_filtrados (período)": medir(filtrar_periodo, consultas),
+    }
+    aleatorio.shuffle(ids)
+    resultados["delete_pedido"] = medir(deletar, pedidos)
+    return resultados
+
+def main():
+    parser = argparse.ArgumentParser(description="PedidoService: repositório em memória x SQLite")
+    parser.add_argument("--pedidos", type=int, default=5000)
+    parser.add_argument("--db", type=Path, default=RAIZ / "benchmarks" / "bench_repositorios.db")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    preparar_sqlite(args.db)
+    from repositories.in_memory_pedido_repository import InMemoryPedidoRepository
+    from repositories.pedido_repository import PedidoRepository
+    from services.pedido_service import PedidoService
+
+    repositorios = {"memória": InMemoryPedidoRepository(), "sqlite": PedidoRepository()}
+    resultados = {nome: executar(PedidoService(repo), args.pedidos, args.seed) for nome, repo in repositorios.items()}
+    print(f"{'operação':36} {'memória (op/s)':>16} {'sqlite (op/s)':>16} {'razão':>8}")
+    for operacao in resultados["memória"]:
+        memoria, sqlite = resultados["memória"][operacao], resultados["sqlite"][operacao]
+        print(f"{operacao:36} {memoria:16.0f} {sqlite:16.0f} {memoria / sqlite:7.1f}x")
+
+if __name__ == "__main__":
+    main()
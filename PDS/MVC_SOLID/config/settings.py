@@ -0,0 +1,34 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+
+    @property
+    def pool_settings(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+@lru_cache
+def get_settings() -> Settings:
+    # Lidas do ambiente uma única vez, na primeira chamada (e não na importação)
+    return Settings(
+        database_url=os.getenv("DATABASE_URL", "mysql+mysqlconnector://root:@localhost/db_pedidos"),
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "1") == "1",
+    )
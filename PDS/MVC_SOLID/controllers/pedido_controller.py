@@ -23,9 +23,19 @@ class PedidoController:
         except ValueError as e:
             self.view.exibir_erro(str(e))
 
-    def listar_e_exibir_pedidos(self):
+    def listar_e_exibir_pedidos(self, limit: int = None, offset: int = 0, formato: str = "texto",
+                                tamanho_pagina: int = 500):
+        # As páginas vêm de um gerador: cada uma é lida e exibida antes da próxima
         try:
-            pedidos = self.service.read_all_pedidos()
+            paginas = self.service.read_pedidos_paginados(tamanho_pagina, offset, limit)
+            self.view.exibir_paginas(paginas, formato)
+        except ValueError as e:
+            self.view.exibir_erro(str(e))
+
+    def buscar_e_exibir_pedidos(self, cliente: str = None, data_inicio: date = None,
+                                data_fim: date = None, produto: str = None):
+        try:
+            pedidos = self.service.read_pedidos_filtrados(cliente, data_inicio, data_fim, produto)
             self.view.exibir_pedidos(pedidos)
         except ValueError as e:
             self.view.exibir_erro(str(e))
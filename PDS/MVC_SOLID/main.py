@@ -1,19 +1,24 @@
+import time
+INICIO = time.perf_counter()
+
+import logging
 from datetime import date
-from models.base import Base
-from config.database import engine
 from repositories.pedido_repository import PedidoRepository
+from repositories.caching_pedido_repository import CachingPedidoRepository
 from services.pedido_service import PedidoService
 from views.pedido_view import PedidoView
 from controllers.pedido_controller import PedidoController
 
-# Criar tabelas no banco, se não existirem
-Base.metadata.create_all(bind=engine)
+# As tabelas são criadas à parte, com "python manage.py create-schema"
 
 if __name__ == "__main__":
-    repository = PedidoRepository()
+    # Sem isso o logger raiz fica em WARNING e as mensagens INFO não aparecem
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    repository = CachingPedidoRepository(PedidoRepository(), max_size=1024, ttl=30)
     service = PedidoService(repository)
     view = PedidoView()
     controller = PedidoController(service, view)
+    logging.getLogger(__name__).info("Inicialização em %.1f ms", (time.perf_counter() - INICIO) * 1000)
 
     # Exemplo de criação e salvamento
     itens_data = [
@@ -35,4 +40,5 @@ if __name__ == "__main__":
     # Exemplo de listagem
     controller.listar_e_exibir_pedidos()
 
+    view.exibir_mensagem(f"Cache de pedidos: {repository.stats()}")
     repository.close()
\ No newline at end of file
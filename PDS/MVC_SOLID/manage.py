@@ -0,0 +1,36 @@
+import argparse
+from config.database import get_engine
+from models.base import Base
+# Registra os modelos no metadata antes do create_all
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from repositories.pedido_repository import PedidoRepository
+from services.pedido_service import PedidoService
+from views.pedido_view import PedidoView
+from controllers.pedido_controller import PedidoController
+
+# Comandos de administração:
+#   python manage.py create-schema
+#   python manage.py list-pedidos [--limit N] [--offset N] [--format texto|jsonl|csv] [--page-size N]
+
+def create_schema(args):
+    # Cria as tabelas que ainda não existem
+    Base.metadata.create_all(bind=get_engine())
+    print("Esquema criado")
+
+def list_pedidos(args):
+    # Listagem paginada, com saída em texto, jsonl ou csv
+    controller = PedidoController(PedidoService(PedidoRepository()), PedidoView())
+    controller.listar_e_exibir_pedidos(args.limit, args.offset, args.format, args.page_size)
+
+COMMANDS = {"create-schema": create_schema, "list-pedidos": list_pedidos}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Administração do sistema de pedidos")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--format", choices=("texto", "jsonl", "csv"), default="texto")
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+    COMMANDS[args.command](args)
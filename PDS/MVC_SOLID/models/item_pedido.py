@@ -5,8 +5,8 @@ from .base import Base
 class ItemPedido(Base):
     __tablename__ = 'item_pedido'
     id = Column(Integer, primary_key=True, autoincrement=True)
-    pedido_id = Column(Integer, ForeignKey('pedido.id'))
-    produto = Column(String(100))
+    pedido_id = Column(Integer, ForeignKey('pedido.id', ondelete="CASCADE"), index=True)
+    produto = Column(String(100), index=True)
     quantidade = Column(Integer)
     preco = Column(DECIMAL(10,2))
 
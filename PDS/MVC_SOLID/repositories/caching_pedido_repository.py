@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from models.pedido import Pedido
+from repositories.ipedido_repository import IPedidoRepository
+from typing import Any, Dict, Iterator, List, Optional
+
+class CachingPedidoRepository(IPedidoRepository):
+    # Decorador de qualquer IPedidoRepository com cache write-through:
+    # - read_by_id: LRU de tamanho limitado, com validade opcional (ttl, em s)
+    # - read_all: uma entrada marcada com a versão do cache, que muda a cada
+    #   escrita; a lista só é reaproveitada se nenhuma escrita passou por aqui
+    # create/update guardam o pedido salvo no LRU; update_fields/delete o removem.
+    # Escritas feitas por outros processos só aparecem depois do ttl
+    def __init__(self, repository: IPedidoRepository, max_size: int = 1024, ttl: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError("max_size deve ser ao menos 1")
+        self.repository = repository
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.por_id: "OrderedDict[int, tuple]" = OrderedDict()
+        self.versao = 0
+        self.todos: Optional[tuple] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expira_em(self) -> Optional[float]:
+        return time.monotonic() + self.ttl if self.ttl is not None else None
+
+    @staticmethod
+    def _expirado(expira_em: Optional[float]) -> bool:
+        return expira_em is not None and time.monotonic() >= expira_em
+
+    def _guardar(self, pedido: Pedido, versao: int) -> None:
+        # versao é a versão esperada do cache: se outra escrita passou por aqui
+        # desde que o pedido foi lido/gravado no repositório, ele pode já estar
+        # desatualizado (ou excluído) e não é guardado
+        with self.lock:
+            if versao != self.versao:
+                return
+            self.por_id[pedido.id] = (pedido, self._expira_em())
+            self.por_id.move_to_end(pedido.id)
+            while len(self.por_id) > self.max_size:
+                self.por_id.popitem(last=False)
+                self.evictions += 1
+
+    def _invalidar(self, pedido_id: Optional[int] = None) -> None:
+        with self.lock:
+            self.versao += 1
+            self.todos = None
+            if pedido_id is not None:
+                self.por_id.pop(pedido_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "expirations": self.expirations, "size": len(self.por_id), "version": self.versao}
+
+    def create(self, pedido: Pedido) -> Pedido:
+        versao = self.versao
+        pedido = self.repository.create(pedido)
+        self._invalidar()
+        # A própria escrita incrementou a versão uma vez
+        self._guardar(pedido, versao + 1)
+        return pedido
+
+    def read_by_id(self, pedido_id: int) -> Optional[Pedido]:
+        with self.lock:
+            entrada = self.por_id.get(pedido_id)
+            if entrada is not None:
+                pedido, expira_em = entrada
+                if not self._expirado(expira_em):
+                    self.por_id.move_to_end(pedido_id)
+                    self.hits += 1
+                    return pedido
+                del self.por_id[pedido_id]
+                self.expirations += 1
+            self.misses += 1
+            versao = self.versao
+        pedido = self.repository.read_by_id(pedido_id)
+        # "Não encontrado" não é guardado: o pedido pode ser criado depois
+        if pedido is not None:
+            self._guardar(pedido, versao)
+        return pedido
+
+    def read_all(self) -> List[Pedido]:
+        with self.lock:
+            if self.todos is not None:
+                versao, pedidos, expira_em = self.todos
+                if versao == self.versao and not self._expirado(expira_em):
+                    self.hits += 1
+                    return list(pedidos)
+                self.todos = None
+            self.misses += 1
+            versao = self.versao
+        pedidos = self.repository.read_all()
+        with self.lock:
+            # Se houve escrita durante a leitura, a lista já nasce desatualizada
+            if versao == self.versao:
+                self.todos = (versao, pedidos, self._expira_em())
+        return list(pedidos)
+
+    def read_pages(self, page_size: int = 500, offset: int = 0,
+                   limit: Optional[int] = None) -> Iterator[List[Pedido]]:
+        # Listagens paginadas não passam pelo cache: guardá-las anularia a
+        # memória constante que a paginação busca
+        return self.repository.read_pages(page_size, offset, limit)
+
+    def read_filtered(self, cliente: str = None, data_inicio: date = None,
+                      data_fim: date = None, produto: str = None) -> List[Pedido]:
+        return self.repository.read_filtered(cliente, data_inicio, data_fim, produto)
+
+    def update(self, pedido: Pedido) -> Pedido:
+        versao = self.versao
+        try:
+            pedido = self.repository.update(pedido)
+        finally:
+            self._invalidar(pedido.id)
+        self._guardar(pedido, versao + 1)
+        return pedido
+
+    def update_fields(self, pedido_id: int, valores: Dict[str, Any]) -> bool:
+        try:
+            return self.repository.update_fields(pedido_id, valores)
+        finally:
+            self._invalidar(pedido_id)
+
+    def delete(self, pedido_id: int) -> None:
+        try:
+            self.repository.delete(pedido_id)
+        finally:
+            self._invalidar(pedido_id)
+
+    def close(self) -> None:
+        close = getattr(self.repository, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,116 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from itertools import count, islice
+from models.pedido import Pedido
+from repositories.ipedido_repository import IPedidoRepository
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+class InMemoryPedidoRepository(IPedidoRepository):
+    # Implementação em memória de IPedidoRepository, sem banco: serve para
+    # testar e medir os serviços separando o custo deles do custo do banco.
+    # Índices por hash: id -> pedido, cliente -> ids e data_pedido -> ids; as
+    # datas distintas ficam também numa lista ordenada para filtrar por período
+    def __init__(self):
+        self.pedidos: Dict[int, Pedido] = {}
+        self.por_cliente: Dict[str, Set[int]] = {}
+        self.por_data: Dict[date, Set[int]] = {}
+        self.datas: List[date] = []
+        # Valores indexados de cada pedido, para reindexar após alterações
+        self.chaves: Dict[int, tuple] = {}
+        self.proximo_id = count(1)
+        self.proximo_item_id = count(1)
+
+    def _indexar(self, pedido: Pedido) -> None:
+        chave = (pedido.cliente, pedido.data_pedido)
+        self.por_cliente.setdefault(pedido.cliente, set()).add(pedido.id)
+        if pedido.data_pedido not in self.por_data:
+            self.por_data[pedido.data_pedido] = set()
+            insort(self.datas, pedido.data_pedido)
+        self.por_data[pedido.data_pedido].add(pedido.id)
+        self.chaves[pedido.id] = chave
+
+    def _desindexar(self, pedido_id: int) -> None:
+        cliente, data_pedido = self.chaves.pop(pedido_id)
+        self._remover(self.por_cliente, cliente, pedido_id)
+        if self._remover(self.por_data, data_pedido, pedido_id):
+            self.datas.pop(bisect_left(self.datas, data_pedido))
+
+    @staticmethod
+    def _remover(indice: dict, chave, pedido_id: int) -> bool:
+        # Devolve True quando a chave ficou sem pedidos e saiu do índice
+        ids = indice[chave]
+        ids.discard(pedido_id)
+        if not ids:
+            del indice[chave]
+            return True
+        return False
+
+    def create(self, pedido: Pedido) -> Pedido:
+        pedido.id = next(self.proximo_id)
+        if pedido.data_pedido is None:
+            pedido.data_pedido = date.today()
+        for item in pedido.itens:
+            item.id = next(self.proximo_item_id)
+            item.pedido_id = pedido.id
+        self.pedidos[pedido.id] = pedido
+        self._indexar(pedido)
+        return pedido
+
+    def read_by_id(self, pedido_id: int) -> Optional[Pedido]:
+        return self.pedidos.get(pedido_id)
+
+    def read_all(self) -> List[Pedido]:
+        return list(self.pedidos.values())
+
+    def read_pages(self, page_size: int = 500, offset: int = 0,
+                   limit: Optional[int] = None) -> Iterator[List[Pedido]]:
+        # Os ids são gerados em ordem crescente, então a ordem de inserção do
+        # dict já é a ordem de id
+        fim = None if limit is None else offset + limit
+        pedidos = islice(list(self.pedidos.values()), offset, fim)
+        while True:
+            pagina = list(islice(pedidos, page_size))
+            if not pagina:
+                return
+            yield pagina
+
+    def read_filtered(self, cliente: str = None, data_inicio: date = None,
+                      data_fim: date = None, produto: str = None) -> List[Pedido]:
+        # Parte do índice mais seletivo disponível (cliente, depois período) e
+        # aplica os demais filtros sobre os candidatos
+        ids: Optional[Set[int]] = None
+        if cliente is not None:
+            ids = set(self.por_cliente.get(cliente, ()))
+        if data_inicio is not None or data_fim is not None:
+            inicio = bisect_left(self.datas, data_inicio) if data_inicio is not None else 0
+            fim = bisect_right(self.datas, data_fim) if data_fim is not None else len(self.datas)
+            no_periodo = set().union(*(self.por_data[d] for d in self.datas[inicio:fim]))
+            ids = no_periodo if ids is None else ids & no_periodo
+        candidatos = self.pedidos.values() if ids is None else (self.pedidos[i] for i in ids)
+        if produto is not None:
+            candidatos = (p for p in candidatos if any(item.produto == produto for item in p.itens))
+        return sorted(candidatos, key=lambda p: p.id)
+
+    def update(self, pedido: Pedido) -> Pedido:
+        if pedido.id not in self.pedidos:
+            raise ValueError("Pedido não encontrado")
+        self.pedidos[pedido.id] = pedido
+        self._desindexar(pedido.id)
+        self._indexar(pedido)
+        return pedido
+
+    def update_fields(self, pedido_id: int, valores: Dict[str, Any]) -> bool:
+        pedido = self.pedidos.get(pedido_id)
+        if pedido is None:
+            return False
+        for campo, valor in valores.items():
+            setattr(pedido, campo, valor)
+        self._desindexar(pedido_id)
+        self._indexar(pedido)
+        return True
+
+    def delete(self, pedido_id: int) -> None:
+        if pedido_id not in self.pedidos:
+            raise ValueError("Pedido não encontrado")
+        self._desindexar(pedido_id)
+        del self.pedidos[pedido_id]
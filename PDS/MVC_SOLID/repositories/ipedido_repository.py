@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import date
 from models.pedido import Pedido
 
@@ -16,10 +16,26 @@ class IPedidoRepository(ABC):
     def read_all(self) -> List[Pedido]:
         pass
 
+    @abstractmethod
+    def read_pages(self, page_size: int = 500, offset: int = 0,
+                   limit: Optional[int] = None) -> Iterator[List[Pedido]]:
+        # Pedidos em ordem de id, em páginas de até page_size, pulando os
+        # offset primeiros e parando após limit pedidos
+        pass
+
+    @abstractmethod
+    def read_filtered(self, cliente: str = None, data_inicio: date = None,
+                      data_fim: date = None, produto: str = None) -> List[Pedido]:
+        pass
+
     @abstractmethod
     def update(self, pedido: Pedido) -> Pedido:
         pass
 
+    @abstractmethod
+    def update_fields(self, pedido_id: int, valores: Dict[str, Any]) -> bool:
+        pass
+
     @abstractmethod
     def delete(self, pedido_id: int) -> None:
         pass
\ No newline at end of file
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from datetime import date
+
+class IRelatorioRepository(ABC):
+    @abstractmethod
+    def order_total(self, pedido_id: int) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def revenue_by_day(self, data_inicio: date = None, data_fim: date = None) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def revenue_by_client(self, data_inicio: date = None, data_fim: date = None, limit: int = 50) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def top_products(self, data_inicio: date = None, data_fim: date = None, limit: int = 10) -> List[dict]:
+        pass
@@ -1,54 +1,151 @@
+from contextlib import contextmanager
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload, joinedload
 from config.database import SessionLocal
 from models.pedido import Pedido
+from models.item_pedido import ItemPedido
 from repositories.ipedido_repository import IPedidoRepository
-from typing import List
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+
+# Estratégias de carregamento de Pedido.itens nas leituras:
+# "selectin" (um SELECT ... IN para todos os itens) ou "joined" (LEFT OUTER JOIN).
+# Os itens são sempre carregados junto com o pedido, porque a sessão é fechada
+# ao fim de cada operação e não haveria como buscá-los depois
+LOADING_STRATEGIES = {
+    "selectin": selectinload,
+    "joined": joinedload,
+}
 
 class PedidoRepository(IPedidoRepository):
-    def __init__(self):
-        self.db = SessionLocal()
+    def __init__(self, loading: str = "selectin"):
+        if loading not in LOADING_STRATEGIES:
+            raise ValueError(f"Estratégia de carregamento inválida: {loading}")
+        self.itens_option = LOADING_STRATEGIES[loading](Pedido.itens)
 
-    def create(self, pedido: Pedido) -> Pedido:
+    @contextmanager
+    def _sessao(self) -> Iterator[Session]:
+        # Uma sessão por operação: o identity map só existe durante a chamada,
+        # então a memória não cresce com os pedidos já lidos e cada leitura vê
+        # o estado atual do banco. Com expire_on_commit=False os objetos
+        # devolvidos continuam legíveis depois que a sessão é fechada
+        db = SessionLocal()
         try:
-            self.db.add(pedido)
-            self.db.commit()
-            self.db.refresh(pedido)
-            return pedido
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise ValueError(f"Erro ao criar pedido: {str(e)}")
+            yield db
+        finally:
+            db.close()
+
+    def create(self, pedido: Pedido) -> Pedido:
+        with self._sessao() as db:
+            try:
+                db.add(pedido)
+                db.commit()
+                return pedido
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao criar pedido: {str(e)}")
 
     def read_by_id(self, pedido_id: int) -> Pedido:
-        try:
-            return self.db.get(Pedido, pedido_id)
-        except SQLAlchemyError as e:
-            raise ValueError(f"Erro ao ler pedido: {str(e)}")
+        with self._sessao() as db:
+            try:
+                return db.get(Pedido, pedido_id, options=[self.itens_option])
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao ler pedido: {str(e)}")
 
     def read_all(self) -> List[Pedido]:
-        try:
-            return self.db.query(Pedido).all()
-        except SQLAlchemyError as e:
-            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+        with self._sessao() as db:
+            try:
+                return db.query(Pedido).options(self.itens_option).all()
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+
+    def read_pages(self, page_size: int = 500, offset: int = 0,
+                   limit: Optional[int] = None) -> Iterator[List[Pedido]]:
+        # Paginação por chave (WHERE id > último id lido): o OFFSET só é usado
+        # na primeira página, então cada página custa o mesmo independente da
+        # posição. Cada página usa a sua sessão, fechada antes do yield
+        ultimo_id = None
+        restantes = limit
+        while restantes is None or restantes > 0:
+            tamanho = page_size if restantes is None else min(page_size, restantes)
+            with self._sessao() as db:
+                try:
+                    query = db.query(Pedido).options(self.itens_option).order_by(Pedido.id)
+                    if ultimo_id is None:
+                        query = query.offset(offset)
+                    else:
+                        query = query.filter(Pedido.id > ultimo_id)
+                    pagina = query.limit(tamanho).all()
+                except SQLAlchemyError as e:
+                    raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+            if not pagina:
+                return
+            yield pagina
+            if len(pagina) < tamanho:
+                return
+            ultimo_id = pagina[-1].id
+            if restantes is not None:
+                restantes -= len(pagina)
+
+    def read_filtered(self, cliente: str = None, data_inicio: date = None,
+                      data_fim: date = None, produto: str = None) -> List[Pedido]:
+        # Os filtros vão para o WHERE e usam os índices declarados nos models;
+        # produto vira pedido.id IN (subconsulta em item_pedido pelo índice de
+        # produto), e não um EXISTS correlacionado, que percorreria pedido inteiro
+        with self._sessao() as db:
+            try:
+                query = db.query(Pedido).options(self.itens_option)
+                if cliente is not None:
+                    query = query.filter(Pedido.cliente == cliente)
+                if data_inicio is not None:
+                    query = query.filter(Pedido.data_pedido >= data_inicio)
+                if data_fim is not None:
+                    query = query.filter(Pedido.data_pedido <= data_fim)
+                if produto is not None:
+                    query = query.filter(Pedido.id.in_(select(ItemPedido.pedido_id)
+                                                       .where(ItemPedido.produto == produto)))
+                return query.order_by(Pedido.id).all()
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao listar pedidos: {str(e)}")
 
     def update(self, pedido: Pedido) -> Pedido:
-        try:
-            self.db.commit()
-            self.db.refresh(pedido)
-            return pedido
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
+        # O pedido vem de outra operação (já fechada): add o associa à nova
+        # sessão, que envia só os atributos alterados
+        with self._sessao() as db:
+            try:
+                db.add(pedido)
+                db.commit()
+                return pedido
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
+
+    def update_fields(self, pedido_id: int, valores: Dict[str, Any]) -> bool:
+        # Um único UPDATE ... WHERE id = ?, sem carregar o pedido; devolve se
+        # alguma linha foi afetada
+        with self._sessao() as db:
+            try:
+                resultado = db.execute(update(Pedido).where(Pedido.id == pedido_id).values(**valores))
+                db.commit()
+                return resultado.rowcount > 0
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
 
     def delete(self, pedido_id: int) -> None:
-        try:
-            pedido = self.read_by_id(pedido_id)
-            if not pedido:
-                raise ValueError("Pedido não encontrado")
-            self.db.delete(pedido)
-            self.db.commit()
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise ValueError(f"Erro ao deletar pedido: {str(e)}")
+        # Um único DELETE: os itens saem pelo ON DELETE CASCADE do banco
+        with self._sessao() as db:
+            try:
+                resultado = db.execute(delete(Pedido).where(Pedido.id == pedido_id))
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao deletar pedido: {str(e)}")
+        if resultado.rowcount == 0:
+            raise ValueError("Pedido não encontrado")
 
     def close(self):
-        self.db.close()
\ No newline at end of file
+        # As sessões já são fechadas a cada operação; mantido para quem chama
+        # close() ao terminar (como o main.py)
+        pass
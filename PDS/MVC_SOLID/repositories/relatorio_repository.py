@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from sqlalchemy import select, func
+from sqlalchemy.exc import SQLAlchemyError
+from config.database import SessionLocal
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from repositories.irelatorio_repository import IRelatorioRepository
+from datetime import date
+from typing import List, Optional
+
+# Agregações calculadas no banco (SUM(quantidade * preco) com GROUP BY): cada
+# relatório é uma única consulta, sem carregar os itens na aplicação
+VALOR_ITEM = ItemPedido.quantidade * ItemPedido.preco
+
+class RelatorioRepository(IRelatorioRepository):
+    @contextmanager
+    def _sessao(self):
+        # Uma sessão por consulta, como no PedidoRepository: sem transação
+        # longa, cada relatório vê o estado atual do banco
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def _periodo(query, data_inicio: Optional[date], data_fim: Optional[date]):
+        if data_inicio is not None:
+            query = query.where(Pedido.data_pedido >= data_inicio)
+        if data_fim is not None:
+            query = query.where(Pedido.data_pedido <= data_fim)
+        return query
+
+    def order_total(self, pedido_id: int) -> Optional[dict]:
+        with self._sessao() as db:
+            try:
+                query = (select(Pedido.id.label("pedido_id"),
+                                func.coalesce(func.sum(VALOR_ITEM), 0).label("total"),
+                                func.count(ItemPedido.id).label("itens"))
+                         .outerjoin(ItemPedido, ItemPedido.pedido_id == Pedido.id)
+                         .where(Pedido.id == pedido_id)
+                         .group_by(Pedido.id))
+                linha = db.execute(query).mappings().first()
+                return dict(linha) if linha else None
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao calcular total do pedido: {str(e)}")
+
+    def revenue_by_day(self, data_inicio: date = None, data_fim: date = None) -> List[dict]:
+        with self._sessao() as db:
+            try:
+                query = (select(Pedido.data_pedido.label("dia"),
+                                func.count(func.distinct(Pedido.id)).label("pedidos"),
+                                func.sum(VALOR_ITEM).label("receita"))
+                         .join(ItemPedido, ItemPedido.pedido_id == Pedido.id))
+                query = self._periodo(query, data_inicio, data_fim).group_by(Pedido.data_pedido).order_by(Pedido.data_pedido)
+                return [dict(linha) for linha in db.execute(query).mappings()]
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao calcular receita por dia: {str(e)}")
+
+    def revenue_by_client(self, data_inicio: date = None, data_fim: date = None, limit: int = 50) -> List[dict]:
+        with self._sessao() as db:
+            try:
+                receita = func.sum(VALOR_ITEM).label("receita")
+                query = (select(Pedido.cliente, func.count(func.distinct(Pedido.id)).label("pedidos"), receita)
+                         .join(ItemPedido, ItemPedido.pedido_id == Pedido.id))
+                query = self._periodo(query, data_inicio, data_fim).group_by(Pedido.cliente).order_by(receita.desc()).limit(limit)
+                return [dict(linha) for linha in db.execute(query).mappings()]
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao calcular receita por cliente: {str(e)}")
+
+    def top_products(self, data_inicio: date = None, data_fim: date = None, limit: int = 10) -> List[dict]:
+        with self._sessao() as db:
+            try:
+                receita = func.sum(VALOR_ITEM).label("receita")
+                query = (select(ItemPedido.produto, func.sum(ItemPedido.quantidade).label("quantidade"), receita)
+                         .join(Pedido, Pedido.id == ItemPedido.pedido_id))
+                query = self._periodo(query, data_inicio, data_fim).group_by(ItemPedido.produto).order_by(receita.desc()).limit(limit)
+                return [dict(linha) for linha in db.execute(query).mappings()]
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao calcular produtos mais vendidos: {str(e)}")
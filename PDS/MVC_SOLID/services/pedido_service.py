@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional
 from datetime import date
 from models.pedido import Pedido
 from models.item_pedido import ItemPedido
@@ -27,13 +27,40 @@ class PedidoService:
     def read_all_pedidos(self) -> List[Pedido]:
         return self.repository.read_all()
 
-    def update_pedido(self, pedido_id: int, novo_cliente: str = None, nova_data: date = None) -> Pedido:
-        pedido = self.read_pedido_by_id(pedido_id)
+    def read_pedidos_paginados(self, tamanho_pagina: int = 500, offset: int = 0,
+                               limit: Optional[int] = None) -> Iterator[List[Pedido]]:
+        if tamanho_pagina < 1:
+            raise ValueError("tamanho_pagina deve ser ao menos 1")
+        if offset < 0:
+            raise ValueError("offset não pode ser negativo")
+        if limit is not None and limit < 0:
+            raise ValueError("limit não pode ser negativo")
+        return self.repository.read_pages(tamanho_pagina, offset, limit)
+
+    def read_pedidos_filtrados(self, cliente: str = None, data_inicio: date = None,
+                               data_fim: date = None, produto: str = None) -> List[Pedido]:
+        if data_inicio and data_fim and data_inicio > data_fim:
+            raise ValueError("data_inicio deve ser anterior a data_fim")
+        return self.repository.read_filtered(cliente, data_inicio, data_fim, produto)
+
+    def patch_pedido(self, pedido_id: int, novo_cliente: str = None, nova_data: date = None) -> None:
+        # Atualização parcial: só os campos informados, em um único UPDATE
+        valores = {}
         if novo_cliente:
-            pedido.cliente = novo_cliente
+            valores["cliente"] = novo_cliente
         if nova_data:
-            pedido.data_pedido = nova_data
-        return self.repository.update(pedido)
+            valores["data_pedido"] = nova_data
+        if not valores:
+            raise ValueError("Nenhum campo para atualizar")
+        if not self.repository.update_fields(pedido_id, valores):
+            raise ValueError("Pedido não encontrado")
+
+    def update_pedido(self, pedido_id: int, novo_cliente: str = None, nova_data: date = None) -> Pedido:
+        # Devolve o pedido atualizado (para exibição): UPDATE seguido da leitura.
+        # Sem campos a alterar não há UPDATE e o pedido é devolvido como está
+        if novo_cliente or nova_data:
+            self.patch_pedido(pedido_id, novo_cliente, nova_data)
+        return self.read_pedido_by_id(pedido_id)
 
     def delete_pedido(self, pedido_id: int) -> None:
         self.repository.delete(pedido_id)
\ No newline at end of file
@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Os módulos da aplicação são importados a partir da raiz (models, repositories...)
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from config.database import get_engine, get_sessionmaker
+from config.settings import get_settings
+from models.base import Base
+# Registra os modelos no metadata antes do create_all
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+
+def _limpar_caches():
+    get_sessionmaker.cache_clear()
+    get_engine.cache_clear()
+    get_settings.cache_clear()
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    # Banco SQLite temporário: o DATABASE_URL é lido na primeira chamada de
+    # get_settings(), então os caches são limpos antes e depois do teste
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'pedidos.db'}")
+    _limpar_caches()
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+    _limpar_caches()
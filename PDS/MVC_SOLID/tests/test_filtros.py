@@ -0,0 +1,35 @@
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from repositories.pedido_repository import PedidoRepository
+
+def plano_de_read_filtered(engine, **filtros) -> str:
+    # Captura o SELECT de pedido emitido por read_filtered e roda
+    # EXPLAIN QUERY PLAN sobre ele, com os mesmos parâmetros
+    consultas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        consultas.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        PedidoRepository().read_filtered(**filtros)
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+    statement, parameters = consultas[0]
+    with engine.connect() as conn:
+        linhas = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return "\n".join(linha[-1] for linha in linhas)
+
+@pytest.mark.parametrize("filtros, indice", [
+    ({"cliente": "Ana"}, "ix_pedido_cliente"),
+    ({"data_inicio": date(2025, 1, 1), "data_fim": date(2025, 1, 31)}, "ix_pedido_data_pedido"),
+    ({"produto": "Livro"}, "ix_item_pedido_produto"),
+])
+def test_filtros_usam_indices(engine, filtros, indice):
+    detalhes = plano_de_read_filtered(engine, **filtros)
+    assert re.search(rf"USING (COVERING )?INDEX {indice}\b", detalhes), detalhes
+    assert "SCAN pedido" not in detalhes, detalhes
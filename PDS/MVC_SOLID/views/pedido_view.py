@@ -1,12 +1,70 @@
+import csv
+import io
+import json
+import sys
 from models.pedido import Pedido
 
+# Formatos de saída das listagens: "texto" para leitura no terminal, "jsonl"
+# (um pedido por linha, com os itens) e "csv" (uma linha por item) para outros
+# programas
+def _texto(pedidos) -> str:
+    linhas = []
+    for p in pedidos:
+        linhas.append(f"Pedido {p.id} - Cliente: {p.cliente} - Data: {p.data_pedido}")
+        for i in p.itens:
+            linhas.append(f"  Produto: {i.produto}, Quantidade: {i.quantidade}, Preço: {i.preco}")
+    linhas.append("")
+    return "\n".join(linhas)
+
+def _jsonl(pedidos) -> str:
+    linhas = []
+    for p in pedidos:
+        pedido = {
+            "id": p.id,
+            "cliente": p.cliente,
+            "data_pedido": p.data_pedido.isoformat() if p.data_pedido else None,
+            # Preço como texto, para não perder a precisão do DECIMAL
+            "itens": [{"produto": i.produto, "quantidade": i.quantidade, "preco": str(i.preco)}
+                      for i in p.itens],
+        }
+        linhas.append(json.dumps(pedido, ensure_ascii=False))
+    linhas.append("")
+    return "\n".join(linhas)
+
+CSV_CABECALHO = ("pedido_id", "cliente", "data_pedido", "produto", "quantidade", "preco")
+
+def _csv(pedidos) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for p in pedidos:
+        if not p.itens:
+            # Pedido sem itens ainda aparece, com as colunas do item vazias
+            writer.writerow((p.id, p.cliente, p.data_pedido, "", "", ""))
+        writer.writerows((p.id, p.cliente, p.data_pedido, i.produto, i.quantidade, i.preco)
+                         for i in p.itens)
+    return buffer.getvalue()
+
+FORMATOS = {"texto": _texto, "jsonl": _jsonl, "csv": _csv}
+
 class PedidoView:
     @staticmethod
-    def exibir_pedidos(pedidos):
-        for p in pedidos:
-            print(f"Pedido {p.id} - Cliente: {p.cliente} - Data: {p.data_pedido}")
-            for i in p.itens:
-                print(f"  Produto: {i.produto}, Quantidade: {i.quantidade}, Preço: {i.preco}")
+    def exibir_pedidos(pedidos, formato: str = "texto", saida=None):
+        PedidoView.exibir_paginas([pedidos], formato, saida)
+
+    @staticmethod
+    def exibir_paginas(paginas, formato: str = "texto", saida=None):
+        # Cada página é montada em memória e enviada com uma única escrita, em
+        # vez de um print por pedido e por item; como as páginas chegam de um
+        # gerador, só uma delas fica em memória por vez
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato inválido: {formato}")
+        renderizar = FORMATOS[formato]
+        saida = saida or sys.stdout
+        if formato == "csv":
+            saida.write(",".join(CSV_CABECALHO) + "\n")
+        for pagina in paginas:
+            saida.write(renderizar(pagina))
+        saida.flush()
 
     @staticmethod
     def exibir_mensagem(mensagem):
@@ -14,4 +72,4 @@ class PedidoView:
 
     @staticmethod
     def exibir_erro(erro):
-        print(f"Erro: {erro}")
\ No newline at end of file
+        print(f"Erro: {erro}")
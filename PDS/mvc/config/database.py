@@ -1,10 +1,36 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
 import logging
+import os
 
 logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
 
-DATABASE_URL = "mysql+mysqlconnector://root:@localhost/db_pedidos"
+# Engine e fábrica de sessão criados no primeiro uso, com a URL lida do
+# ambiente (DATABASE_URL). Importar os módulos não abre conexões.
+# Sem AUTOCOMMIT, cada operação do controlador é uma transação com um único
+# commit; com expire_on_commit=False o pedido salvo continua válido depois do
+# commit, sem o SELECT extra do refresh
 
-engine = create_engine(DATABASE_URL, echo=False, isolation_level="AUTOCOMMIT")
-SessionLocal = sessionmaker(bind=engine)
\ No newline at end of file
+def _ativar_foreign_keys(dbapi_connection, connection_record):
+    # O SQLite só aplica o ON DELETE CASCADE de item_pedido com o PRAGMA
+    # ligado em cada conexão
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+@lru_cache
+def get_engine():
+    database_url = os.getenv("DATABASE_URL", "mysql+mysqlconnector://root:@localhost/db_pedidos")
+    engine = create_engine(database_url, echo=False)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _ativar_foreign_keys)
+    return engine
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker:
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+# Mantém a forma de uso SessionLocal()
+def SessionLocal():
+    return get_sessionmaker()()
@@ -0,0 +1,206 @@
+import csv
+import json
+import time
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from itertools import groupby
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from config.database import SessionLocal
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from views.pedido_view import PedidoView
+
+# Importação em massa de pedidos a partir de CSV ou JSON Lines.
+# CSV: uma linha por item, com as colunas pedido_id, cliente, data_pedido,
+# produto, quantidade e preco (o mesmo formato de "list-pedidos --format csv");
+# pedido_id é só a chave de agrupamento, os pedidos recebem ids novos.
+# JSONL: um objeto por linha, no mesmo formato por item do CSV ou um pedido
+# inteiro com a lista "itens" (o formato de "list-pedidos --format jsonl").
+# As linhas de um mesmo pedido devem vir juntas: o arquivo é lido em fluxo e
+# agrupado por linhas consecutivas, sem guardar o arquivo em memória
+
+def _linhas_csv(arquivo):
+    leitor = csv.DictReader(arquivo)
+    for registro in leitor:
+        yield leitor.line_num, registro
+
+def _linhas_jsonl(arquivo):
+    for numero, linha in enumerate(arquivo, start=1):
+        if not linha.strip():
+            continue
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as e:
+            yield numero, {"_erro": f"JSON inválido: {e.msg}", "_linha": linha.strip()}
+            continue
+        if not isinstance(registro, dict):
+            yield numero, {"_erro": "Linha não é um objeto JSON", "_linha": linha.strip()}
+            continue
+        itens = registro.pop("itens", None)
+        if itens is None:
+            yield numero, registro
+        elif not isinstance(itens, list) or not all(isinstance(item, dict) for item in itens):
+            # Vai para os rejeitados como qualquer linha inválida, em vez de
+            # interromper a leitura do arquivo
+            yield numero, {"_erro": "\"itens\" deve ser uma lista de objetos", "_linha": linha.strip(),
+                           "pedido_id": registro.get("id")}
+        elif not itens:
+            yield numero, dict(registro, pedido_id=registro.get("id"))
+        else:
+            for item in itens:
+                yield numero, dict(item, pedido_id=registro.get("id"), cliente=registro.get("cliente"),
+                                   data_pedido=registro.get("data_pedido"))
+
+LEITORES = {"csv": _linhas_csv, "jsonl": _linhas_jsonl}
+
+def _texto(valor) -> str:
+    return "" if valor is None else str(valor).strip()
+
+def _chave(linha):
+    # Agrupa pelo pedido_id do arquivo ou, sem ele, por cliente e data
+    _, registro = linha
+    pedido_id = _texto(registro.get("pedido_id"))
+    return pedido_id or (_texto(registro.get("cliente")), _texto(registro.get("data_pedido")))
+
+def _pedido(registro) -> dict:
+    if "_erro" in registro:
+        raise ValueError(registro["_erro"])
+    cliente = _texto(registro.get("cliente"))
+    if not cliente:
+        raise ValueError("Cliente é obrigatório")
+    if len(cliente) > 100:
+        raise ValueError("Cliente com mais de 100 caracteres")
+    data_pedido = _texto(registro.get("data_pedido"))
+    try:
+        data_pedido = date.fromisoformat(data_pedido) if data_pedido else date.today()
+    except ValueError:
+        raise ValueError(f"Data inválida: {data_pedido}")
+    return {"cliente": cliente, "data_pedido": data_pedido}
+
+def _item(registro):
+    # Devolve None para a linha de um pedido sem itens (colunas do item vazias)
+    produto = _texto(registro.get("produto"))
+    quantidade = _texto(registro.get("quantidade"))
+    preco = _texto(registro.get("preco"))
+    if not (produto or quantidade or preco):
+        return None
+    if not produto:
+        raise ValueError("Produto é obrigatório")
+    if len(produto) > 100:
+        raise ValueError("Produto com mais de 100 caracteres")
+    try:
+        quantidade = int(quantidade)
+    except ValueError:
+        raise ValueError(f"Quantidade inválida: {quantidade}")
+    if quantidade <= 0:
+        raise ValueError("Quantidade deve ser positiva")
+    try:
+        preco = Decimal(preco)
+    except InvalidOperation:
+        raise ValueError(f"Preço inválido: {preco}")
+    if not preco.is_finite() or preco < 0:
+        raise ValueError(f"Preço inválido: {preco}")
+    return {"produto": produto, "quantidade": quantidade, "preco": preco}
+
+class ImportacaoController:
+    def __init__(self, tamanho_lote=5000):
+        if tamanho_lote < 1:
+            raise ValueError("tamanho_lote deve ser ao menos 1")
+        self.tamanho_lote = tamanho_lote
+        self.view = PedidoView()
+
+    def importar(self, caminho, formato=None, rejeitos=None):
+        # Lê o arquivo em fluxo e grava a cada tamanho_lote pedidos, com um
+        # commit por lote; uma linha inválida é rejeitada (e registrada em
+        # rejeitos, se informado) junto com o resto do seu pedido, sem
+        # interromper a importação
+        formato = formato or ("jsonl" if caminho.endswith((".jsonl", ".ndjson")) else "csv")
+        if formato not in LEITORES:
+            raise ValueError(f"Formato inválido: {formato}")
+        estatisticas = {"linhas": 0, "pedidos": 0, "itens": 0, "rejeitadas": 0}
+        inicio = time.perf_counter()
+        db = SessionLocal()
+        saida_rejeitos = open(rejeitos, "w", newline="", encoding="utf-8") if rejeitos else None
+        try:
+            registro_rejeitos = csv.writer(saida_rejeitos) if saida_rejeitos else None
+            if registro_rejeitos:
+                registro_rejeitos.writerow(("linha", "motivo", "registro"))
+            lote = []
+            with open(caminho, newline="", encoding="utf-8-sig") as arquivo:
+                for _, grupo in groupby(LEITORES[formato](arquivo), key=_chave):
+                    pedido = self._agrupar(list(grupo), estatisticas, registro_rejeitos)
+                    if pedido is not None:
+                        lote.append(pedido)
+                    if len(lote) >= self.tamanho_lote:
+                        self._gravar(db, lote, estatisticas)
+                        lote = []
+                        self._progresso(estatisticas, inicio)
+            if lote:
+                self._gravar(db, lote, estatisticas)
+        finally:
+            db.close()
+            if saida_rejeitos:
+                saida_rejeitos.close()
+        self._progresso(estatisticas, inicio, final=True)
+        return estatisticas
+
+    @staticmethod
+    def _agrupar(linhas, estatisticas, registro_rejeitos):
+        # Monta o pedido a partir das suas linhas (cliente e data vêm da
+        # primeira). Se alguma linha for inválida o pedido inteiro é rejeitado,
+        # para não gravar um pedido sem parte dos itens
+        estatisticas["linhas"] += len(linhas)
+        pedido, itens, motivos = None, [], []
+        for numero, registro in linhas:
+            try:
+                if pedido is None:
+                    pedido = _pedido(registro)
+                item = _item(registro)
+                if item is not None:
+                    itens.append(item)
+                motivos.append(None)
+            except ValueError as e:
+                motivos.append(str(e))
+        if pedido is not None and not any(motivos):
+            pedido["itens"] = itens
+            return pedido
+        estatisticas["rejeitadas"] += len(linhas)
+        if registro_rejeitos:
+            for (numero, registro), motivo in zip(linhas, motivos):
+                original = registro.get("_linha") or json.dumps(registro, ensure_ascii=False, default=str)
+                registro_rejeitos.writerow((numero, motivo or "Outra linha do pedido é inválida", original))
+        return None
+
+    @staticmethod
+    def _gravar(db, lote, estatisticas):
+        # Um INSERT multi-linha para os pedidos e um executemany para os itens,
+        # sem criar objetos do ORM. Os ids dos pedidos vêm do RETURNING quando o
+        # banco suporta; sem ele (MySQL), do lastrowid de um INSERT por pedido,
+        # como em create_many: mais lento, mas seguro com inclusões concorrentes
+        linhas = [{"cliente": p["cliente"], "data_pedido": p["data_pedido"]} for p in lote]
+        try:
+            if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+                ids = db.scalars(insert(Pedido).returning(Pedido.id, sort_by_parameter_order=True),
+                                 linhas).all()
+            else:
+                ids = [db.execute(insert(Pedido).values(**linha)).inserted_primary_key[0]
+                       for linha in linhas]
+            itens = [dict(item, pedido_id=pedido_id)
+                     for pedido_id, pedido in zip(ids, lote) for item in pedido["itens"]]
+            if itens:
+                db.execute(insert(ItemPedido), itens)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise ValueError(f"Erro ao importar lote de pedidos: {str(e)}")
+        estatisticas["pedidos"] += len(lote)
+        estatisticas["itens"] += len(itens)
+
+    def _progresso(self, estatisticas, inicio, final=False):
+        decorrido = time.perf_counter() - inicio
+        taxa = estatisticas["linhas"] / decorrido if decorrido > 0 else 0.0
+        self.view.exibir_mensagem(
+            f"{'Importação concluída' if final else 'Importando'}: {estatisticas['linhas']} linhas, "
+            f"{estatisticas['pedidos']} pedidos, {estatisticas['itens']} itens, "
+            f"{estatisticas['rejeitadas']} rejeitadas em {decorrido:.1f} s ({taxa:.0f} linhas/s)")
@@ -1,4 +1,7 @@
+from contextlib import contextmanager
+from sqlalchemy import delete, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
 from config.database import SessionLocal
 from models.pedido import Pedido
 from models.item_pedido import ItemPedido
@@ -6,63 +9,132 @@ from views.pedido_view import PedidoView
 
 class PedidoController:
     def __init__(self):
-        self.db = SessionLocal()
         self.view = PedidoView()  # Instancia a View
 
-    def salvar_pedido(self, cliente, itens_data):
+    @contextmanager
+    def _sessao(self):
+        # Uma sessão (e uma transação) por chamada: ao fechar a sessão a
+        # transação termina, então nenhuma leitura deixa a conexão "idle in
+        # transaction" nem prende as leituras seguintes a um snapshot antigo.
+        # Com expire_on_commit=False os objetos devolvidos continuam legíveis
+        db = SessionLocal()
         try:
-            pedido = Pedido(cliente=cliente)
-            pedido.itens = [ItemPedido(**item) for item in itens_data]
-            self.db.add(pedido)
-            self.db.commit()
-            self.db.refresh(pedido)
-            return pedido
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise ValueError(f"Erro ao salvar pedido: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Erro inesperado: {str(e)}")
+            yield db
+        finally:
+            db.close()
+
+    def salvar_pedido(self, cliente, itens_data):
+        with self._sessao() as db:
+            try:
+                pedido = Pedido(cliente=cliente)
+                pedido.itens = [ItemPedido(**item) for item in itens_data]
+                db.add(pedido)
+                db.commit()
+                return pedido
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao salvar pedido: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Erro inesperado: {str(e)}")
+
+    def atualizar_campos(self, pedido_id, novo_cliente=None, nova_data=None):
+        # Atualização parcial (PATCH): um único UPDATE ... WHERE id = ? só com os
+        # campos informados, sem carregar o pedido; o "não encontrado" vem do
+        # número de linhas afetadas
+        valores = {}
+        if novo_cliente is not None:
+            valores["cliente"] = novo_cliente
+        if nova_data is not None:
+            valores["data_pedido"] = nova_data
+        if not valores:
+            raise ValueError("Nenhum campo para atualizar")
+        with self._sessao() as db:
+            try:
+                resultado = db.execute(update(Pedido).where(Pedido.id == pedido_id).values(**valores))
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Erro inesperado: {str(e)}")
+        if resultado.rowcount == 0:
+            raise ValueError("Pedido não encontrado")
 
     def atualizar_pedido(self, pedido_id, novo_cliente=None, nova_data=None):
-        try:
-            pedido = self.db.get(Pedido, pedido_id)
-            if not pedido:
-                raise ValueError("Pedido não encontrado")
-            if novo_cliente is not None:
-                pedido.cliente = novo_cliente
-            if nova_data is not None:
-                pedido.data_pedido = nova_data
-            self.db.commit()
-            return pedido
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise ValueError(f"Erro ao atualizar pedido: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Erro inesperado: {str(e)}")
+        # Devolve o pedido atualizado; sem campos a alterar, devolve o pedido
+        # como está (sem UPDATE)
+        if novo_cliente is not None or nova_data is not None:
+            self.atualizar_campos(pedido_id, novo_cliente, nova_data)
+        with self._sessao() as db:
+            try:
+                # Itens carregados já aqui: a sessão é fechada ao fim da leitura
+                pedido = db.get(Pedido, pedido_id, options=[selectinload(Pedido.itens)])
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao ler pedido: {str(e)}")
+        if not pedido:
+            raise ValueError("Pedido não encontrado")
+        return pedido
 
     def deletar_pedido(self, pedido_id):
-        try:
-            pedido = self.db.get(Pedido, pedido_id)
-            if not pedido:
-                raise ValueError("Pedido não encontrado")
-            self.db.delete(pedido)
-            self.db.commit()
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise ValueError(f"Erro ao deletar pedido: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Erro inesperado: {str(e)}")
+        # Um único DELETE: os itens são removidos pelo ON DELETE CASCADE do banco
+        with self._sessao() as db:
+            try:
+                resultado = db.execute(delete(Pedido).where(Pedido.id == pedido_id))
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                raise ValueError(f"Erro ao deletar pedido: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Erro inesperado: {str(e)}")
+        if resultado.rowcount == 0:
+            raise ValueError("Pedido não encontrado")
 
     def listar_pedidos_com_itens(self):
-        try:
-            return self.db.query(Pedido).all()
-        except SQLAlchemyError as e:
-            raise ValueError(f"Erro ao listar pedidos: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Erro inesperado: {str(e)}")
+        with self._sessao() as db:
+            try:
+                # selectinload busca os itens de todos os pedidos em uma única consulta
+                return db.query(Pedido).options(selectinload(Pedido.itens)).all()
+            except SQLAlchemyError as e:
+                raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Erro inesperado: {str(e)}")
+
+    def listar_paginas(self, tamanho_pagina=500, offset=0, limit=None):
+        # Gerador de páginas em ordem de id, paginadas por chave (WHERE id >
+        # último id lido; OFFSET só na primeira). Cada página usa a sua sessão,
+        # fechada antes do yield: nenhuma transação fica aberta enquanto a
+        # página é exibida
+        if tamanho_pagina < 1:
+            raise ValueError("tamanho_pagina deve ser ao menos 1")
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset e limit não podem ser negativos")
+        ultimo_id = None
+        restantes = limit
+        while restantes is None or restantes > 0:
+            tamanho = tamanho_pagina if restantes is None else min(tamanho_pagina, restantes)
+            with self._sessao() as db:
+                try:
+                    query = db.query(Pedido).options(selectinload(Pedido.itens)).order_by(Pedido.id)
+                    if ultimo_id is None:
+                        query = query.offset(offset)
+                    else:
+                        query = query.filter(Pedido.id > ultimo_id)
+                    pagina = query.limit(tamanho).all()
+                except SQLAlchemyError as e:
+                    raise ValueError(f"Erro ao listar pedidos: {str(e)}")
+            if not pagina:
+                return
+            yield pagina
+            if len(pagina) < tamanho:
+                return
+            ultimo_id = pagina[-1].id
+            if restantes is not None:
+                restantes -= len(pagina)
 
     def fechar(self):
-        self.db.close()
+        # As sessões já são fechadas a cada chamada; mantido para quem chama
+        # fechar() ao terminar (como o main.py)
+        pass
 
     # Métodos que integram com View
     def criar_e_salvar_pedido(self, cliente, itens_data):
@@ -80,9 +152,9 @@ class PedidoController:
         except ValueError as e:
             self.view.exibir_erro(str(e))
 
-    def listar_e_exibir(self):
+    def listar_e_exibir(self, limit=None, offset=0, formato="texto", tamanho_pagina=500):
+        # As páginas vêm de um gerador: cada uma é lida e exibida antes da próxima
         try:
-            pedidos = self.listar_pedidos_com_itens()
-            self.view.exibir_pedidos(pedidos)
+            self.view.exibir_paginas(self.listar_paginas(tamanho_pagina, offset, limit), formato)
         except ValueError as e:
             self.view.exibir_erro(str(e))
\ No newline at end of file
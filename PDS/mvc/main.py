@@ -1,12 +1,16 @@
-from models.base import Base
-from config.database import engine
+import time
+INICIO = time.perf_counter()
+
+import logging
 from controllers.pedido_controller import PedidoController
 
-# Criar tabelas no banco, se não existirem
-Base.metadata.create_all(bind=engine)
+# As tabelas são criadas à parte, com "python manage.py create-schema"
 
 if __name__ == "__main__":
+    # Sem isso o logger raiz fica em WARNING e as mensagens INFO não aparecem
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     controller = PedidoController()
+    logging.getLogger(__name__).info("Inicialização em %.1f ms", (time.perf_counter() - INICIO) * 1000)
 
     # Exemplo de criação e salvamento
     itens_data = [
@@ -0,0 +1,48 @@
+import argparse
+from config.database import get_engine
+from models.base import Base
+# Registra os modelos no metadata antes do create_all
+from models.pedido import Pedido
+from models.item_pedido import ItemPedido
+from controllers.pedido_controller import PedidoController
+from controllers.importacao_controller import ImportacaoController
+
+# Comandos de administração:
+#   python manage.py create-schema
+#   python manage.py list-pedidos [--limit N] [--offset N] [--format texto|jsonl|csv] [--page-size N]
+#   python manage.py import-pedidos ARQUIVO [--input-format csv|jsonl] [--batch-size N] [--rejects ARQUIVO]
+
+def create_schema(args):
+    # Cria as tabelas que ainda não existem
+    Base.metadata.create_all(bind=get_engine())
+    print("Esquema criado")
+
+def list_pedidos(args):
+    # Listagem paginada, com saída em texto, jsonl ou csv
+    controller = PedidoController()
+    try:
+        controller.listar_e_exibir(args.limit, args.offset, args.format, args.page_size)
+    finally:
+        controller.fechar()
+
+def import_pedidos(args):
+    # Importação em massa de um CSV/JSONL de pedidos e itens
+    if not args.path:
+        raise SystemExit("Informe o arquivo a importar")
+    ImportacaoController(args.batch_size).importar(args.path, args.input_format, args.rejects)
+
+COMMANDS = {"create-schema": create_schema, "list-pedidos": list_pedidos, "import-pedidos": import_pedidos}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Administração do sistema de pedidos (MVC)")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--format", choices=("texto", "jsonl", "csv"), default="texto")
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--input-format", choices=("csv", "jsonl"), default=None)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--rejects", default=None)
+    args = parser.parse_args()
+    COMMANDS[args.command](args)
@@ -6,6 +6,9 @@ from .base import Base
 class Pedido(Base):
     __tablename__ = 'pedido'
     id = Column(Integer, primary_key=True, autoincrement=True)
-    cliente = Column(String(100))
-    data_pedido = Column(Date, default=date.today)
-    itens = relationship("ItemPedido", back_populates="pedido", cascade="all, delete-orphan")
\ No newline at end of file
+    cliente = Column(String(100), index=True)
+    data_pedido = Column(Date, default=date.today, index=True)
+    # passive_deletes: ao excluir um pedido, os itens são removidos pelo
+    # ON DELETE CASCADE do banco, sem carregá-los
+    itens = relationship("ItemPedido", back_populates="pedido", cascade="all, delete-orphan",
+                         passive_deletes=True)
\ No newline at end of file
@@ -0,0 +1,66 @@
+# Vazão de GerenciadorPedidos.processar_pedidos com um gateway simulado.
+#
+# Cada pagamento leva ~latencia segundos (PagamentoSimulado); o mesmo lote de
+# pedidos é processado com concorrências diferentes. Com concorrência 1 o
+# resultado equivale a chamar processar_pedido em sequência; a vazão deve
+# crescer quase linearmente até o limite do loop/gateway.
+#
+#   python benchmarks/bench_pipeline.py --pedidos 1000 --latencia 0.2 --concorrencias 1 10 50 200
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from gerenciador_pedidos import Etapa, GerenciadorPedidos
+from item import ItemDigital, ItemFisico
+from pedido import Pedido
+from processador_pagamento import PagamentoCartaoCredito, PagamentoSimulado
+
+class RepositorioSilencioso:
+    # O RepositorioPedido imprime cada pedido; aqui só contamos
+    def __init__(self):
+        self.salvos = 0
+
+    async def salvar(self, pedido):
+        self.salvos += 1
+
+def gerar_pedidos(quantidade: int):
+    # Gerador: os pedidos são criados conforme o pipeline consome
+    for id_pedido in range(1, quantidade + 1):
+        yield Pedido(id_pedido, [ItemFisico("Livro", 50.0), ItemDigital("E-book", 30.0)])
+
+async def processar(gerenciador, pedidos, concorrencia: int, etapas) -> tuple:
+    # Consome os resultados conforme saem, sem guardá-los
+    total = falhas = 0
+    async for resultado in gerenciador.processar_pedidos(pedidos, concorrencia, etapas):
+        total += 1
+        falhas += not resultado.sucesso
+    return total, falhas
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline assíncrono de pedidos com gateway simulado")
+    parser.add_argument("--pedidos", type=int, default=1000)
+    parser.add_argument("--latencia", type=float, default=0.2)
+    parser.add_argument("--taxa-falha", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=2.0)
+    parser.add_argument("--tentativas", type=int, default=3)
+    parser.add_argument("--concorrencias", type=int, nargs="+", default=[1, 10, 50, 200])
+    args = parser.parse_args()
+
+    etapas = {"pagamento": Etapa(timeout=args.timeout, tentativas=args.tentativas)}
+    for concorrencia in args.concorrencias:
+        gateway = PagamentoSimulado(latencia=args.latencia, variacao=args.latencia / 4,
+                                    taxa_falha=args.taxa_falha, semente=concorrencia)
+        gerenciador = GerenciadorPedidos(PagamentoCartaoCredito(), RepositorioSilencioso(), gateway)
+        inicio = time.perf_counter()
+        total, falhas = asyncio.run(processar(gerenciador, gerar_pedidos(args.pedidos), concorrencia, etapas))
+        decorrido = time.perf_counter() - inicio
+        print(f"concorrência {concorrencia:4d}: {total} pedidos em {decorrido:7.2f} s "
+              f"({total / decorrido:8.1f} pedidos/s), {falhas} falhas")
+
+if __name__ == "__main__":
+    main()
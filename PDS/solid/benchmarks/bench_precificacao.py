@@ -0,0 +1,89 @@
+# Precificação em lote (MotorPrecificacao) contra o caminho por objeto.
+#
+# O caminho por objeto é o que o sistema faz hoje para cada pedido:
+# Pedido.calcular_total() mais calcular_custo_envio() de cada item. O motor
+# monta as colunas uma vez (tempo medido à parte) e calcula todos os pedidos em
+# operações vetorizadas; os totais dos dois caminhos são conferidos centavo a
+# centavo antes de mostrar os tempos.
+#
+#   python benchmarks/bench_precificacao.py --pedidos 200000 --repeticoes 5
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from item import ItemDigital, ItemFisico
+from pedido import Pedido
+from precificacao import MotorPrecificacao, PedidosColunares, para_centavos
+
+class ItemPesado(ItemFisico):
+    # Envio calculado a partir do próprio item: confere que o motor chama
+    # calcular_custo_envio de cada item, e não um valor por classe
+    def __init__(self, nome, preco, peso):
+        super().__init__(nome, preco)
+        self.peso = peso
+
+    def calcular_custo_envio(self):
+        return round(10.0 + 2.5 * self.peso, 2)
+
+def gerar_pedidos(quantidade: int, semente: int) -> list:
+    aleatorio = random.Random(semente)
+    pedidos = []
+    for id_pedido in range(1, quantidade + 1):
+        itens = []
+        for _ in range(aleatorio.randint(1, 6)):
+            nome, preco = f"Produto {aleatorio.randrange(1000)}", round(aleatorio.uniform(1, 500), 2)
+            sorteio = aleatorio.random()
+            if sorteio < 0.5:
+                itens.append(ItemFisico(nome, preco))
+            elif sorteio < 0.7:
+                itens.append(ItemPesado(nome, preco, aleatorio.randint(1, 30)))
+            else:
+                itens.append(ItemDigital(nome, preco))
+        pedidos.append(Pedido(id_pedido, itens))
+    return pedidos
+
+def por_objeto(pedidos) -> list:
+    return [pedido.calcular_total() + sum(item.calcular_custo_envio() for item in pedido.itens)
+            for pedido in pedidos]
+
+def melhor_tempo(funcao, repeticoes: int):
+    melhor, resultado = float("inf"), None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Precificação em lote x por objeto")
+    parser.add_argument("--pedidos", type=int, default=200_000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    pedidos = gerar_pedidos(args.pedidos, args.semente)
+    motor = MotorPrecificacao()
+
+    t_objeto, esperados = melhor_tempo(lambda: por_objeto(pedidos), args.repeticoes)
+    t_colunas, colunas = melhor_tempo(lambda: PedidosColunares(pedidos), 1)
+    t_motor, resultado = melhor_tempo(lambda: motor.precificar(colunas), args.repeticoes)
+
+    divergentes = sum(1 for esperado, obtido in zip(esperados, resultado.totais.tolist())
+                      if para_centavos(esperado) != obtido)
+    if divergentes:
+        raise SystemExit(f"{divergentes} pedidos com total diferente entre os dois caminhos")
+
+    itens = len(colunas.precos)
+    print(f"{args.pedidos} pedidos, {itens} itens (melhor de {args.repeticoes})")
+    print(f"  por objeto:          {t_objeto * 1000:9.1f} ms  ({args.pedidos / t_objeto:12,.0f} pedidos/s)")
+    print(f"  montagem das colunas: {t_colunas * 1000:8.1f} ms  (uma vez)")
+    print(f"  motor vetorizado:    {t_motor * 1000:9.1f} ms  ({args.pedidos / t_motor:12,.0f} pedidos/s)")
+    print(f"  ganho por simulação: {t_objeto / t_motor:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,163 @@
 # gerenciador_pedidos.py
 # Classe para gerenciar pedidos, respeitando DIP
-from processador_pagamento import ProcessadorPagamento
+import asyncio
+import inspect
+from processador_pagamento import (AdaptadorPagamentoAssincrono, ProcessadorPagamento,
+                                   ProcessadorPagamentoAssincrono)
 from repositorio_pedido import RepositorioPedido
 
+class Etapa:
+    # Limites de uma etapa do pipeline: tempo máximo por tentativa (segundos),
+    # número de tentativas e espera antes de repetir (dobrada a cada falha)
+    def __init__(self, timeout=2.0, tentativas=3, espera=0.1):
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera = espera
+
+# O pagamento só é repetido (com tentativas > 1) se o processador for
+# idempotente; por padrão, uma tentativa só
+ETAPAS_PADRAO = {"pagamento": Etapa(timeout=2.0, tentativas=1), "salvar": Etapa(timeout=1.0, tentativas=3)}
+
+# Só erros passageiros são repetidos; os demais falham na hora
+ERROS_TRANSITORIOS = (ConnectionError, TimeoutError, asyncio.TimeoutError)
+
+class FalhaEtapa(Exception):
+    def __init__(self, etapa, tentativas, erro):
+        motivo = "tempo esgotado" if isinstance(erro, asyncio.TimeoutError) else str(erro) or type(erro).__name__
+        super().__init__(f"Falha em {etapa} após {tentativas} tentativa(s): {motivo}")
+        self.etapa = etapa
+        self.tentativas = tentativas
+        self.erro = erro
+
+class ResultadoProcessamento:
+    def __init__(self, pedido, total=None, erro=None):
+        self.pedido = pedido
+        self.total = total
+        self.erro = erro
+
+    @property
+    def sucesso(self):
+        return self.erro is None
+
 class GerenciadorPedidos:
-    def __init__(self, processador_pagamento: ProcessadorPagamento, repositorio: RepositorioPedido):
+    def __init__(self, processador_pagamento: ProcessadorPagamento, repositorio: RepositorioPedido,
+                 processador_assincrono: ProcessadorPagamentoAssincrono = None):
         self.processador_pagamento = processador_pagamento
         self.repositorio = repositorio
+        # Sem um processador assíncrono, o síncrono é usado em threads
+        self.processador_assincrono = processador_assincrono or AdaptadorPagamentoAssincrono(processador_pagamento)
 
     def processar_pedido(self, pedido):
         total = pedido.calcular_total()
         self.processador_pagamento.processar_pagamento(total)
-        self.repositorio.salvar(pedido)
\ No newline at end of file
+        self.repositorio.salvar(pedido)
+
+    async def processar_pedidos(self, pedidos, concorrencia=10, etapas=None):
+        # Gerador assíncrono: processa um fluxo de pedidos (iterável ou iterável
+        # assíncrono) com no máximo `concorrencia` pedidos em andamento e entrega
+        # cada ResultadoProcessamento assim que ele termina:
+        #   async for resultado in gerenciador.processar_pedidos(pedidos): ...
+        # Um produtor alimenta uma fila limitada, `concorrencia` trabalhadores
+        # consomem dela e os resultados passam por outra fila limitada; nada
+        # acumula, então a memória não cresce com o tamanho do fluxo (se quem
+        # consome demora, os trabalhadores esperam). Cada pedido passa pelas
+        # mesmas etapas de processar_pedido; uma falha não interrompe os demais
+        # e fica registrada no resultado. Quem parar antes do fim deve fechar o
+        # gerador (contextlib.aclosing) para encerrar os trabalhadores na hora
+        if concorrencia < 1:
+            raise ValueError("concorrencia deve ser ao menos 1")
+        etapas = {**ETAPAS_PADRAO, **(etapas or {})}
+        entrada = asyncio.Queue(maxsize=concorrencia)
+        saida = asyncio.Queue(maxsize=concorrencia)
+        fim = object()
+
+        async def produtor():
+            try:
+                async for pedido in _iterar(pedidos):
+                    await entrada.put(pedido)
+            finally:
+                # Sinal de fim para cada trabalhador, mesmo se a leitura falhar
+                for _ in range(concorrencia):
+                    await entrada.put(None)
+
+        async def trabalhador():
+            try:
+                while (pedido := await entrada.get()) is not None:
+                    await saida.put(await self._processar_assincrono(pedido, etapas))
+            except Exception as e:
+                # Erro inesperado (fora das etapas): repassado a quem consome
+                await saida.put(e)
+                return
+            await saida.put(fim)
+
+        tarefa_produtor = asyncio.create_task(produtor())
+        trabalhadores = [asyncio.create_task(trabalhador()) for _ in range(concorrencia)]
+        try:
+            ativos = concorrencia
+            while ativos:
+                resultado = await saida.get()
+                if resultado is fim:
+                    ativos -= 1
+                elif isinstance(resultado, Exception):
+                    raise resultado
+                else:
+                    yield resultado
+            # Repassa um erro na leitura do fluxo de pedidos, se houve
+            await tarefa_produtor
+        finally:
+            # Também quando quem consome para antes do fim (break/aclose)
+            for tarefa in (tarefa_produtor, *trabalhadores):
+                tarefa.cancel()
+            await asyncio.gather(tarefa_produtor, *trabalhadores, return_exceptions=True)
+
+    async def _processar_assincrono(self, pedido, etapas):
+        try:
+            total = pedido.calcular_total()
+        except Exception as e:
+            return ResultadoProcessamento(pedido, erro=FalhaEtapa("total", 1, e))
+        processador = self.processador_assincrono
+        # Em uma thread, o timeout não interrompe a chamada: repeti-la criaria
+        # uma segunda execução em paralelo com a primeira
+        em_thread = isinstance(processador, AdaptadorPagamentoAssincrono)
+        salvar_em_thread = not inspect.iscoroutinefunction(self.repositorio.salvar)
+        try:
+            # O id do pedido é a chave de idempotência: a mesma em todas as
+            # tentativas, para o gateway reconhecer a repetição
+            await _executar_etapa("pagamento", etapas["pagamento"],
+                                  lambda: processador.processar_pagamento(total, pedido.id_pedido),
+                                  repetir=processador.idempotente, repetir_timeout=not em_thread)
+            await _executar_etapa("salvar", etapas["salvar"], lambda: self._salvar(pedido),
+                                  repetir_timeout=not salvar_em_thread)
+        except FalhaEtapa as e:
+            return ResultadoProcessamento(pedido, total, e)
+        return ResultadoProcessamento(pedido, total)
+
+    async def _salvar(self, pedido):
+        # Repositórios com salvar assíncrono são aguardados; os síncronos rodam
+        # em uma thread
+        if inspect.iscoroutinefunction(self.repositorio.salvar):
+            return await self.repositorio.salvar(pedido)
+        return await asyncio.to_thread(self.repositorio.salvar, pedido)
+
+async def _iterar(pedidos):
+    if hasattr(pedidos, "__aiter__"):
+        async for pedido in pedidos:
+            yield pedido
+    else:
+        for pedido in pedidos:
+            yield pedido
+
+async def _executar_etapa(nome, etapa: Etapa, chamada, repetir=True, repetir_timeout=True):
+    # chamada cria uma nova corrotina a cada tentativa. Só erros de
+    # ERROS_TRANSITORIOS são repetidos, e timeouts só com repetir_timeout
+    tentativas = etapa.tentativas if repetir else 1
+    for tentativa in range(1, tentativas + 1):
+        try:
+            return await asyncio.wait_for(chamada(), etapa.timeout)
+        except Exception as e:
+            transitorio = isinstance(e, ERROS_TRANSITORIOS)
+            if isinstance(e, (TimeoutError, asyncio.TimeoutError)) and not repetir_timeout:
+                transitorio = False
+            if tentativa == tentativas or not transitorio:
+                raise FalhaEtapa(nome, tentativa, e) from e
+            await asyncio.sleep(etapa.espera * 2 ** (tentativa - 1))
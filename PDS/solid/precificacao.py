@@ -0,0 +1,91 @@
+# precificacao.py
+# Precificação em lote: muitos pedidos de uma vez, em arrays colunares (NumPy)
+#
+# Os itens de todos os pedidos ficam em colunas (preço, quantidade, envio), com
+# os itens de cada pedido contíguos e um array de deslocamentos marcando onde
+# cada pedido começa. Os valores são guardados em centavos inteiros (int64):
+# somas e multiplicações são exatas e o arredondamento acontece em um único
+# ponto, de forma explícita (ROUND_HALF_UP para centavos).
+from decimal import Decimal, ROUND_HALF_UP
+import numpy as np
+
+CENTAVO = Decimal("0.01")
+# Fatores de reajuste são aceitos com até 4 casas decimais
+ESCALA_FATOR = 10_000
+
+def para_centavos(valor) -> int:
+    # str() evita levar para o Decimal o erro de representação do float
+    return int((Decimal(str(valor)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def de_centavos(centavos) -> Decimal:
+    return (Decimal(int(centavos)) / 100).quantize(CENTAVO)
+
+class PedidosColunares:
+    # Colunas montadas uma vez a partir dos objetos Pedido/Item e reaproveitadas
+    # em quantas simulações de preço forem necessárias
+    def __init__(self, pedidos):
+        self.ids = [pedido.id_pedido for pedido in pedidos]
+        precos, quantidades, envios, tamanhos = [], [], [], []
+        # O custo de envio é pedido a cada item (calcular_custo_envio), já que
+        # uma subclasse de Item pode calculá-lo a partir dos próprios dados
+        # (peso, destino...); o custo fica só na montagem, feita uma vez
+        for pedido in pedidos:
+            tamanhos.append(len(pedido.itens))
+            for item in pedido.itens:
+                precos.append(para_centavos(item.preco))
+                quantidades.append(getattr(item, "quantidade", 1))
+                envios.append(para_centavos(item.calcular_custo_envio()))
+        self.precos = np.array(precos, dtype=np.int64)
+        self.quantidades = np.array(quantidades, dtype=np.int64)
+        self.envios = np.array(envios, dtype=np.int64)
+        self.deslocamentos = np.zeros(len(tamanhos) + 1, dtype=np.int64)
+        np.cumsum(tamanhos, out=self.deslocamentos[1:])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def somar_por_pedido(self, valores: np.ndarray) -> np.ndarray:
+        # Soma por pedido via soma acumulada: como os itens de um pedido são
+        # contíguos, o total é a diferença da soma acumulada nas bordas
+        # (pedidos sem itens dão 0)
+        acumulado = np.zeros(len(valores) + 1, dtype=np.int64)
+        np.cumsum(valores, out=acumulado[1:])
+        return acumulado[self.deslocamentos[1:]] - acumulado[self.deslocamentos[:-1]]
+
+class ResultadoPrecificacao:
+    # Valores por pedido, em centavos
+    def __init__(self, ids, subtotais: np.ndarray, envios: np.ndarray):
+        self.ids = ids
+        self.subtotais = subtotais
+        self.envios = envios
+        self.totais = subtotais + envios
+
+    def total(self, indice: int) -> Decimal:
+        return de_centavos(self.totais[indice])
+
+    def como_decimais(self):
+        # (id_pedido, subtotal, envio, total) em Decimal, para exibição
+        return [(id_pedido, de_centavos(s), de_centavos(e), de_centavos(t))
+                for id_pedido, s, e, t in zip(self.ids, self.subtotais, self.envios, self.totais)]
+
+class MotorPrecificacao:
+    def precificar(self, colunas: PedidosColunares, fator=None) -> ResultadoPrecificacao:
+        # subtotal = soma(preço x quantidade), o mesmo que Pedido.calcular_total
+        # quando a quantidade é 1; envio = soma(envio do item x quantidade).
+        # fator reajusta os preços unitários (ex.: Decimal("1.075") para +7,5%),
+        # arredondando cada preço reajustado para o centavo (meio para cima)
+        precos = colunas.precos
+        if fator is not None:
+            precos = self.reajustar(precos, fator)
+        subtotais = colunas.somar_por_pedido(precos * colunas.quantidades)
+        envios = colunas.somar_por_pedido(colunas.envios * colunas.quantidades)
+        return ResultadoPrecificacao(colunas.ids, subtotais, envios)
+
+    @staticmethod
+    def reajustar(precos: np.ndarray, fator) -> np.ndarray:
+        escalado = Decimal(str(fator)) * ESCALA_FATOR
+        if escalado != escalado.to_integral_value() or escalado < 0:
+            raise ValueError(f"Fator de reajuste inválido: {fator}")
+        # Divisão inteira com metade do divisor somada: ROUND_HALF_UP exato
+        # para valores não negativos, sem passar por float
+        return (precos * int(escalado) + ESCALA_FATOR // 2) // ESCALA_FATOR
@@ -1,6 +1,8 @@
 # processador_pagamento.py
 # Classes para processamento de pagamento, respeitando OCP
 from abc import ABC, abstractmethod
+import asyncio
+import random
 
 class ProcessadorPagamento(ABC):
     @abstractmethod
@@ -13,4 +15,53 @@ class PagamentoCartaoCredito(ProcessadorPagamento):
 
 class PagamentoPayPal(ProcessadorPagamento):
     def processar_pagamento(self, valor):
-        print(f"Processando pagamento de {valor} via PayPal")
\ No newline at end of file
+        print(f"Processando pagamento de {valor} via PayPal")
+
+# Interface assíncrona, ao lado da síncrona: gateways reais levam centenas de
+# milissegundos por pagamento, e com asyncio vários pedidos esperam ao mesmo tempo
+class ProcessadorPagamentoAssincrono(ABC):
+    # idempotente: o processador garante que repetir a chamada com a mesma
+    # chave_idempotencia não cobra de novo (o gateway descarta a duplicata).
+    # Só assim o pipeline repete um pagamento que falhou ou estourou o tempo
+    idempotente = False
+
+    @abstractmethod
+    async def processar_pagamento(self, valor, chave_idempotencia=None):
+        pass
+
+class AdaptadorPagamentoAssincrono(ProcessadorPagamentoAssincrono):
+    # Usa um ProcessadorPagamento síncrono no pipeline assíncrono, rodando cada
+    # chamada em uma thread para não bloquear o loop. Nunca é idempotente: um
+    # timeout não interrompe a thread, e repetir iniciaria uma segunda cobrança
+    # com a primeira ainda em andamento
+    def __init__(self, processador: ProcessadorPagamento):
+        self.processador = processador
+
+    async def processar_pagamento(self, valor, chave_idempotencia=None):
+        return await asyncio.to_thread(self.processador.processar_pagamento, valor)
+
+class PagamentoSimulado(ProcessadorPagamentoAssincrono):
+    # Gateway de mentira para medir a vazão: cada pagamento espera latencia
+    # segundos (mais ou menos variacao) e falha com probabilidade taxa_falha.
+    # Como um gateway real com chave de idempotência, não cobra duas vezes a
+    # mesma chave
+    idempotente = True
+
+    def __init__(self, latencia=0.2, variacao=0.05, taxa_falha=0.0, semente=None):
+        self.latencia = latencia
+        self.variacao = variacao
+        self.taxa_falha = taxa_falha
+        self.aleatorio = random.Random(semente)
+        self.pagamentos = 0
+        self.cobrados = set()
+
+    async def processar_pagamento(self, valor, chave_idempotencia=None):
+        await asyncio.sleep(max(0.0, self.aleatorio.uniform(self.latencia - self.variacao,
+                                                            self.latencia + self.variacao)))
+        if self.aleatorio.random() < self.taxa_falha:
+            raise ConnectionError("Falha simulada no gateway de pagamento")
+        if chave_idempotencia is not None:
+            if chave_idempotencia in self.cobrados:
+                return
+            self.cobrados.add(chave_idempotencia)
+        self.pagamentos += 1